@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import time
+
+from pybytom.libs.backends import (
+    available_backends, set_backend
+)
+from pybytom.wallet import (
+    Wallet, iter_addresses, derivation_cache
+)
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "..", "tests", "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+# The speedup depends on the backend, batch inversion of the point encodings only runs
+# on the python backend, and on the number of addresses the change node is shared by.
+SIZES: tuple = (100, 500, 2_000)
+
+
+def wallet_per_address(addresses_count: int) -> list:
+    addresses = []
+    for index in range(addresses_count):
+        wallet: Wallet = Wallet(network="mainnet")
+        wallet.from_xprivate_key(_["wallet"]["xprivate_key"])
+        wallet.from_path(f"m/44/153/1/0/{index}")
+        addresses.append(wallet.address())
+    return addresses
+
+
+def addresses_per_second(function, addresses_count: int) -> float:
+    derivation_cache.clear()
+    start = time.perf_counter()
+    function(addresses_count)
+    return addresses_count / (time.perf_counter() - start)
+
+
+def streamed(addresses_count: int) -> list:
+    return [
+        address for index, public_key, program, address in iter_addresses(
+            _["wallet"]["xpublic_key"], stop=addresses_count
+        )
+    ]
+
+
+for backend in available_backends():
+    set_backend(backend)
+    assert wallet_per_address(SIZES[0]) == streamed(SIZES[0])
+    for size in SIZES:
+        before = addresses_per_second(wallet_per_address, size)
+        after = addresses_per_second(streamed, size)
+        print(f"{backend} backend, {size} addresses:")
+        print(f"  Wallet per address: {before:.1f} addresses/sec")
+        print(f"  iter_addresses: {after:.1f} addresses/sec")
+        print(f"  Speedup: {after / before:.2f}x")
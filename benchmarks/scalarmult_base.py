@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+from typing import List
+
+import json
+import os
+import timeit
+
+from pybytom.libs.ed25519 import (
+    B, l, ident, edwards_add, edwards_double, encodepoint, decodeint, scalarmult_B
+)
+from pybytom.wallet.tools import get_bytes
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "..", "tests", "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+ROUNDS: int = 20
+
+# Bpow[i] == scalarmult(B, 2**i), the table used before the comb tables.
+Bpow: list = []
+P = B
+for i in range(253):
+    Bpow.append(P)
+    P = edwards_double(P)
+
+
+def scalarmult_B_bpow(e: int) -> tuple:
+    e = e % l
+    P = ident
+    for i in range(253):
+        if e & 1:
+            P = edwards_add(P, Bpow[i])
+        e = e // 2
+    return P
+
+
+SCALARS: List[int] = [
+    decodeint(get_bytes(_["wallet"][key])[:32])
+    for key in ["xprivate_key", "expand_xprivate_key", "child_xprivate_key", "private_key"]
+]
+
+for scalar in SCALARS:
+    assert encodepoint(scalarmult_B_bpow(scalar)) == encodepoint(scalarmult_B(scalar))
+
+
+def keys_per_second(function) -> float:
+    seconds = timeit.timeit(
+        lambda: [encodepoint(function(scalar)) for scalar in SCALARS], number=ROUNDS
+    )
+    return (ROUNDS * len(SCALARS)) / seconds
+
+
+before, after = keys_per_second(scalarmult_B_bpow), keys_per_second(scalarmult_B)
+print(f"Bpow double-and-add: {before:.1f} keys/sec")
+print(f"Signed radix-16 comb: {after:.1f} keys/sec")
+print(f"Speedup: {after / before:.2f}x")
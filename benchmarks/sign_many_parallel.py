@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+
+from typing import List, Tuple
+
+import hashlib
+import json
+import os
+import time
+
+from pybytom.signature import sign_many_parallel
+from pybytom.wallet.tools import get_child_xprivate_key
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "..", "tests", "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+ADDRESSES: int = 16
+MESSAGES: int = 250
+
+# Sweep of many deposit addresses, a few sign datas each.
+PRIVATE_KEYS: List[str] = [
+    get_child_xprivate_key(xprivate_key=_["wallet"]["xprivate_key"], path=f"m/44/153/1/0/{address}")
+    for address in range(ADDRESSES)
+]
+JOBS: List[Tuple[str, str]] = [
+    (PRIVATE_KEYS[index % ADDRESSES], hashlib.sha256(str(index).encode()).hexdigest())
+    for index in range(ADDRESSES * MESSAGES)
+]
+
+if __name__ == "__main__":
+    baseline = None
+    for workers in range(1, (os.cpu_count() or 1) + 1):
+        start = time.perf_counter()
+        sign_many_parallel(JOBS, workers=workers)
+        seconds = time.perf_counter() - start
+        baseline = baseline or seconds
+        print(f"{workers} worker(s): {len(JOBS) / seconds:.1f} signatures/sec, "
+              f"{baseline / seconds:.2f}x speedup ({baseline / seconds / workers:.0%} efficiency)")
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+from typing import List, Tuple
+
+import hashlib
+import time
+
+from pybytom.libs.ed25519 import PIPPENGER_THRESHOLD
+from pybytom.signature import (
+    sign, verify, verify_batch
+)
+from pybytom.wallet.tools import get_xpublic_key
+
+# Straus below PIPPENGER_THRESHOLD points, Pippenger from there on, the batch equation
+# takes two points per entry.
+SIZES: Tuple[int, ...] = (16, 64, PIPPENGER_THRESHOLD // 2 + 1, 256, 1_024)
+
+
+def make_entries(size: int) -> List[Tuple[str, str, str]]:
+    # one signature per key, the worst case for the decode cache
+    entries = []
+    for index in range(size):
+        private_key = hashlib.sha512(str(index).encode()).hexdigest()
+        message = hashlib.sha256(str(index).encode()).hexdigest()
+        entries.append((get_xpublic_key(private_key)[:64], message, sign(private_key=private_key, message=message)))
+    return entries
+
+
+def seconds(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    for size in SIZES:
+        entries = make_entries(size)
+        # one bad signature, found by bisection
+        bad_entries = entries[:-1] + [(entries[-1][0], entries[0][1], entries[-1][2])]
+        assert verify_batch(entries) == [verify(*entry) for entry in entries] == [True] * size
+
+        serial = seconds(lambda: [verify(*entry) for entry in entries])
+        batch = seconds(lambda: verify_batch(entries))
+        bisected = seconds(lambda: verify_batch(bad_entries))
+        print(f"{size} signatures ({'Pippenger' if 2 * size >= PIPPENGER_THRESHOLD else 'Straus'}):")
+        print(f"  verify: {size / serial:.1f} signatures/sec")
+        print(f"  verify_batch: {size / batch:.1f} signatures/sec, {serial / batch:.2f}x speedup")
+        print(f"  verify_batch, one bad: {size / bisected:.1f} signatures/sec, {serial / bisected:.2f}x speedup")
@@ -8,10 +8,10 @@ from .wallet import (
 from .transaction import (
     Transaction, NormalTransaction, AdvancedTransaction
 )
-from .signature import sign, verify
+from .signature import sign, verify, verify_batch
 
 __all__: List[str] = [
     "Wallet", "DEFAULT_PATH", "DEFAULT_INDEXES",
     "Transaction", "NormalTransaction", "AdvancedTransaction",
-    "sign", "verify"
+    "sign", "verify", "verify_batch"
 ]
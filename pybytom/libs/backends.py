@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+
+"""
+Ed25519 group and scalar operations behind a common interface, so key
+derivation and signing can run on an accelerated library when one is
+installed and fall back to the pure-Python ed25519 module otherwise.
+
+Points are opaque to callers, they only go through the backend that made
+them. Scalars and encoded points are 32 byte little-endian strings.
+"""
+
+from typing import (
+    Dict, List, Optional
+)
+
+import os
+
+from . import ed25519
+
+
+class PythonBackend:
+    """
+    Pure-Python backend on top of the ed25519 module, always available.
+    """
+
+    name: str = "python"
+
+    def scalarmult_base(self, scalar: bytes):
+        return ed25519.scalarmult_B(ed25519.decodeint(scalar))
+
+    def point_add(self, P, Q):
+        return ed25519.edwards_add(P, Q)
+
+    def encode_point(self, P) -> bytes:
+        return ed25519.encodepoint(P)
+
+    def encode_points(self, points: list) -> List[bytes]:
+        return ed25519.encodepoints(points)
+
+    def decode_point(self, s: bytes):
+        return ed25519.decodepoint_cached(s)
+
+    def scalar_reduce(self, s: bytes) -> bytes:
+        return ed25519.scalar_reduce(s)
+
+    def scalar_muladd(self, a: bytes, b: bytes, c: bytes) -> bytes:
+        return ed25519.scalar_muladd(a, b, c)
+
+
+class NaClBackend:
+    """
+    libsodium backend through PyNaCl, points are kept in their encoding.
+    """
+
+    name: str = "nacl"
+    identity: bytes = b"\x01" + bytes(31)
+
+    def __init__(self):
+        from nacl import bindings
+        from nacl.exceptions import RuntimeError as NaClError
+
+        # PyNaCl before 1.4 has neither the flags nor the functions
+        if not getattr(bindings, "has_crypto_core_ed25519", False) or \
+                not getattr(bindings, "has_crypto_scalarmult_ed25519", False):
+            raise ImportError("PyNaCl or libsodium is too old for the ed25519 core functions.")
+        self.bindings, self.error = bindings, NaClError
+
+    def scalarmult_base(self, scalar: bytes) -> bytes:
+        # noclamp ignores the top bit and refuses zero, so reduce first
+        scalar = self.scalar_reduce(scalar)
+        if scalar == bytes(32):
+            return self.identity
+        return self.bindings.crypto_scalarmult_ed25519_base_noclamp(scalar)
+
+    def point_add(self, P: bytes, Q: bytes) -> bytes:
+        try:
+            return self.bindings.crypto_core_ed25519_add(P, Q)
+        except self.error:
+            raise ValueError("adding point that is not on curve")
+
+    def encode_point(self, P: bytes) -> bytes:
+        return P
+
+    def encode_points(self, points: List[bytes]) -> List[bytes]:
+        return list(points)
+
+    def decode_point(self, s: bytes) -> bytes:
+        # adding the identity validates and canonicalizes the encoding
+        return self.point_add(bytes(s[:32]), self.identity)
+
+    def scalar_reduce(self, s: bytes) -> bytes:
+        if len(s) > 64:
+            return ed25519.scalar_reduce(s)
+        return self.bindings.crypto_core_ed25519_scalar_reduce(bytes(s).ljust(64, b"\x00"))
+
+    def scalar_muladd(self, a: bytes, b: bytes, c: bytes) -> bytes:
+        # scalar_mul expects reduced scalars, while ours can go up to 2**256
+        a, b, c = self.scalar_reduce(a), self.scalar_reduce(b), self.scalar_reduce(c)
+        return self.bindings.crypto_core_ed25519_scalar_add(
+            self.bindings.crypto_core_ed25519_scalar_mul(a, b), c
+        )
+
+
+# Backend classes by name, in the order of preference.
+BACKENDS: Dict[str, type] = {
+    "nacl": NaClBackend,
+    "python": PythonBackend
+}
+
+_backend = None
+
+
+def available_backends() -> List[str]:
+    """
+    Names of the backends that can be loaded here.
+    """
+
+    names: List[str] = []
+    for name, backend in BACKENDS.items():
+        try:
+            backend()
+            names.append(name)
+        except (ImportError, AttributeError, OSError):
+            # missing, too old or broken libraries, like a libsodium that can't be loaded
+            pass
+    return names
+
+
+def set_backend(name: Optional[str] = None):
+    """
+    Select the backend by name, or the preferred available one if name is None.
+    """
+
+    global _backend
+    if name is None:
+        name = available_backends()[0]
+    if name not in BACKENDS:
+        raise ValueError(f"Invalid '{name}' ed25519 backend, choose only {list(BACKENDS)} backends.")
+    _backend = BACKENDS[name]()
+    return _backend
+
+
+def get_backend():
+    """
+    The selected backend, the PYBYTOM_ED25519_BACKEND environment variable
+    or the preferred available one on first use.
+    """
+
+    if _backend is None:
+        return set_backend(os.environ.get("PYBYTOM_ED25519_BACKEND"))
+    return _backend
@@ -31,6 +31,7 @@ arithmetic, so we cannot handle secrets without risking their disclosure.
 """
 
 from binascii import hexlify, unhexlify
+from functools import lru_cache
 
 import hashlib
 import operator
@@ -91,8 +92,10 @@ def inv(z):
     return pow2(z2_250_0, 5) * z11 % q            # 2^255 - 2^5 + 11 = q - 2
 
 
-d = -121665 * inv(121666) % q
-I = pow(2, (q - 1) // 4, q)
+# d == -121665 * inv(121666) % q
+d = 37095705934669439343138083508754565189542113879843219016388785533085940283555
+# I == pow(2, (q - 1) // 4, q)
+I = 19681161376707505956807079304988542015446066515923890162744021073123829784752
 
 
 def xrecover(y):
@@ -108,8 +111,9 @@ def xrecover(y):
     return x
 
 
-By = 4 * inv(5)
-Bx = xrecover(By)
+# By == 4 * inv(5) and Bx == xrecover(By)
+By = 46316835694926478169428394003475163141307993866256225615783033603165251855960
+Bx = 15112221349535400772501151409588531511454012693041857206046113283949847762202
 B = (Bx % q, By % q, 1, (Bx * By) % q)
 ident = (0, 1, 1, 0)
 
@@ -157,28 +161,244 @@ def edwards_double(P):
     return x3 % q, y3 % q, z3 % q, t3 % q
 
 
-def scalarmult(P, e):
+def edwards_neg(P):
+    (x, y, z, t) = P
+    return -x % q, y, z, -t % q
+
+
+def wnaf(e, w=5):
+    """
+    Width-w non-adjacent form of e >= 0, least significant digit first.
+    Every non-zero digit is odd, lies in (-2**(w-1), 2**(w-1)) and is
+    followed by at least w - 1 zeros.
+    """
+    digits = []
+    while e > 0:
+        if e & 1:
+            digit = e & ((1 << w) - 1)
+            if digit >= 1 << (w - 1):
+                digit -= 1 << w
+            e -= digit
+        else:
+            digit = 0
+        digits.append(digit)
+        e >>= 1
+    return digits
+
+
+def odd_multiples(P, w=5):
+    # [P, 3P, 5P, ..., (2**(w-1) - 1)P]
+    P2 = edwards_double(P)
+    odd = [P]
+    for i in range((1 << (w - 2)) - 1):
+        odd.append(edwards_add(odd[i], P2))
+    return odd
+
+
+def scalarmult(P, e, w=5):
+    """
+    Iterative wNAF double-and-add, using a per-call table of the odd
+    multiples P, 3P, ..., (2**(w-1) - 1)P. A negative e multiplies -P.
+    """
     if e == 0:
         return ident
-    Q = scalarmult(P, e // 2)
-    Q = edwards_double(Q)
-    if e & 1:
-        Q = edwards_add(Q, P)
+    if e < 0:
+        # wnaf only recodes e >= 0
+        return scalarmult(edwards_neg(P), -e, w)
+    odd = odd_multiples(P, w)
+    Q = None
+    for digit in reversed(wnaf(e, w)):
+        if Q is not None:
+            Q = edwards_double(Q)
+        if digit > 0:
+            Q = odd[digit >> 1] if Q is None else edwards_add(Q, odd[digit >> 1])
+        elif digit < 0:
+            Q = edwards_add(Q, edwards_neg(odd[-digit >> 1]))
     return Q
 
 
-# Bpow[i] == scalarmult(B, 2**i)
-Bpow = []
+def edwards_add_niels(P, N):
+    # Mixed addition with a precomputed affine point N == (y2+x2, y2-x2, 2*d*t2),
+    # formula sequence 'madd-2008-hwcd-3' from the same source as edwards_add.
+    (x1, y1, z1, t1) = P
+    (ypx2, ymx2, t2d2) = N
 
+    a = (y1-x1)*ymx2 % q
+    b = (y1+x1)*ypx2 % q
+    c = t1*t2d2 % q
+    dd = 2*z1 % q
+    e = b - a
+    f = dd - c
+    g = dd + c
+    h = b + a
+    x3 = e*f
+    y3 = g*h
+    t3 = e*h
+    z3 = f*g
 
-def make_Bpow():
-    P = B
-    for i in range(253):
-        Bpow.append(P)
-        P = edwards_double(P)
+    return x3 % q, y3 % q, z3 % q, t3 % q
 
 
-make_Bpow()
+def straus(scalars, points, w=5):
+    """
+    sum(scalarmult(P, e) for e, P in zip(scalars, points)) by interleaving
+    the wNAF walks of every scalar, so all of them share one chain of
+    doublings.
+    """
+    tables, digits = [], []
+    for e, P in zip(scalars, points):
+        if e:
+            tables.append(odd_multiples(P, w))
+            digits.append(wnaf(e, w))
+    Q = ident
+    for i in reversed(range(max(map(len, digits), default=0))):
+        Q = edwards_double(Q)
+        for odd, ds in zip(tables, digits):
+            if i < len(ds) and ds[i]:
+                if ds[i] > 0:
+                    Q = edwards_add(Q, odd[ds[i] >> 1])
+                else:
+                    Q = edwards_add(Q, edwards_neg(odd[-ds[i] >> 1]))
+    return Q
+
+
+def pippenger(scalars, points):
+    """
+    sum(scalarmult(P, e) for e, P in zip(scalars, points)) with the
+    bucket method, whose cost grows like n / log(n) per scalar bit.
+    """
+    bits = max((e.bit_length() for e in scalars), default=0)
+    n = len(points)
+    # windows * (bucket additions + bucket aggregation)
+    c = min(range(1, 17), key=lambda c: -(-bits // c) * (n + (2 << c)))
+    mask = (1 << c) - 1
+    Q = None
+    for shift in reversed(range(0, bits, c)):
+        if Q is not None:
+            for i in range(c):
+                Q = edwards_double(Q)
+        buckets = [None] * mask
+        for e, P in zip(scalars, points):
+            k = (e >> shift) & mask
+            if k:
+                buckets[k - 1] = P if buckets[k - 1] is None else edwards_add(buckets[k - 1], P)
+        # sum(k * buckets[k - 1]) as a sum of running sums
+        running = total = None
+        for bucket in reversed(buckets):
+            if bucket is not None:
+                running = bucket if running is None else edwards_add(running, bucket)
+            if running is not None:
+                total = running if total is None else edwards_add(total, running)
+        if total is not None:
+            Q = total if Q is None else edwards_add(Q, total)
+    return ident if Q is None else Q
+
+
+# Point count from which pippenger beats straus.
+PIPPENGER_THRESHOLD = 190
+
+
+def multiscalarmult(scalars, points):
+    """
+    sum(scalarmult(P, e) for e, P in zip(scalars, points)), for e >= 0.
+    """
+    if len(points) < PIPPENGER_THRESHOLD:
+        return straus(scalars, points)
+    return pippenger(scalars, points)
+
+
+def inv_batch(zs):
+    """
+    Montgomery's simultaneous inversion: [inv(z) for z in zs] for the
+    price of one inv and 3 * (len(zs) - 1) multiplications.
+    """
+    if not zs:
+        return []
+    acc = [zs[0]]
+    for z in zs[1:]:
+        acc.append(acc[-1] * z % q)
+    ai = inv(acc[-1])
+    zis = [0] * len(zs)
+    for i in range(len(zs) - 1, 0, -1):
+        zis[i] = acc[i - 1] * ai % q
+        ai = ai * zs[i] % q
+    zis[0] = ai
+    return zis
+
+
+def to_niels(P, zi=None):
+    (x, y, z, t) = P
+    if zi is None:
+        zi = inv(z)
+    x = (x * zi) % q
+    y = (y * zi) % q
+    return (y + x) % q, (y - x) % q, 2 * d * x * y % q
+
+
+def make_comb_table(P):
+    """
+    Build a signed radix-16 comb table for P.
+
+    table[i][j] == to_niels(scalarmult(P, (j + 1) * 16**i)) for 64 windows
+    of 4 bits each and multiples 1..8, which is enough for any scalar < 2**255.
+    """
+    rows = []
+    for i in range(64):
+        row = [P]
+        for j in range(7):
+            row.append(edwards_add(row[j], P))
+        rows.append(row)
+        # 16 * P == 2 * (8 * P)
+        P = edwards_double(row[7])
+    zis = iter(inv_batch([R[2] for row in rows for R in row]))
+    return [[to_niels(R, next(zis)) for R in row] for row in rows]
+
+
+def radix16(e):
+    """
+    Recode 0 <= e < 2**255 into 64 signed digits, all in [-8, 8) except
+    the top one which is in [0, 8], such that e == sum(digits[i] * 16**i).
+    """
+    digits = []
+    for i in range(64):
+        digits.append(e & 15)
+        e >>= 4
+    carry = 0
+    for i in range(63):
+        digits[i] += carry
+        carry = (digits[i] + 8) >> 4
+        digits[i] -= carry << 4
+    digits[63] += carry
+    return digits
+
+
+def scalarmult_comb(table, e):
+    """
+    scalarmult(P, e) using a make_comb_table(P) table: at most 64
+    additions and no doublings, for 0 <= e < 2**255.
+    """
+    # e isn't reduced modulo l, that would be wrong for a P with a small order component
+    if not 0 <= e < 2 ** 255:
+        raise ValueError("comb table scalar out of range, it must be 0 <= e < 2**255")
+    P = ident
+    for row, digit in zip(table, radix16(e)):
+        if digit > 0:
+            P = edwards_add_niels(P, row[digit - 1])
+        elif digit < 0:
+            (ypx, ymx, t2d) = row[-digit - 1]
+            P = edwards_add_niels(P, (ymx, ypx, -t2d))
+    return P
+
+
+# Btable[i][j] == to_niels(scalarmult(B, (j + 1) * 16**i)), built on first use
+Btable = []
+
+
+def make_Btable():
+    if not Btable:
+        # assign the whole table at once, so no thread sees it half built
+        Btable[:] = make_comb_table(B)
+    return Btable
 
 
 def scalarmultbase(e):
@@ -190,22 +410,11 @@ def scalarmult_B(e):
     Implements scalarmult(B, e) more efficiently.
     """
     # scalarmult(B, l) is the identity
-    e = e % l
-    P = ident
-    for i in range(253):
-        if e & 1:
-            P = edwards_add(P, Bpow[i])
-        e = e // 2
-    assert e == 0, e
-    return P
+    return scalarmult_comb(make_Btable(), e % l)
 
 
 def encodeint(y):
-    bits = [(y >> i) & 1 for i in range(b)]
-    return b"".join([
-        int2byte(sum([bits[i * 8 + j] << j for j in range(8)]))
-        for i in range(b//8)
-    ])
+    return (y & ((1 << b) - 1)).to_bytes(b // 8, "little")
 
 
 def encodepoint(P):
@@ -213,31 +422,44 @@ def encodepoint(P):
     zi = inv(z)
     x = (x * zi) % q
     y = (y * zi) % q
-    bits = [(y >> i) & 1 for i in range(b - 1)] + [x & 1]
-    return b"".join([
-        int2byte(sum([bits[i * 8 + j] << j for j in range(8)]))
-        for i in range(b // 8)
-    ])
+    return (y | ((x & 1) << (b - 1))).to_bytes(b // 8, "little")
+
+
+def encodepoints(points):
+    """
+    [encodepoint(P) for P in points], sharing a single field inversion
+    across all the points.
+    """
+    encoded = []
+    for (x, y, z, t), zi in zip(points, inv_batch([P[2] for P in points])):
+        x = (x * zi) % q
+        y = (y * zi) % q
+        encoded.append((y | ((x & 1) << (b - 1))).to_bytes(b // 8, "little"))
+    return encoded
 
 
 def bit(h, i):
     return (indexbytes(h, i // 8) >> (i % 8)) & 1
 
 
+def clamp(h):
+    # 2 ** (b - 2) + sum(2 ** i * bit(h, i) for i in range(3, b - 2))
+    return (1 << (b - 2)) | (decodeint(h) & ((1 << (b - 2)) - 8))
+
+
 def publickey_unsafe(sk):
     """
     Not safe to use with secret keys or secret data.
     See module docstring.  This function should be used for testing only.
     """
     h = H(sk)
-    a = 2 ** (b - 2) + sum(2 ** i * bit(h, i) for i in range(3, b - 2))
+    a = clamp(h)
     A = scalarmult_B(a)
     return encodepoint(A)
 
 
 def Hint(m):
-    h = H(m)
-    return sum(2 ** i * bit(h, i) for i in range(2 * b))
+    return int.from_bytes(H(m), "little")
 
 
 def signature_unsafe(m, sk, pk):
@@ -246,10 +468,8 @@ def signature_unsafe(m, sk, pk):
     See module docstring.  This function should be used for testing only.
     """
     h = H(sk)
-    a = 2 ** (b - 2) + sum(2 ** i * bit(h, i) for i in range(3, b - 2))
-    r = Hint(
-        intlist2bytes([indexbytes(h, j) for j in range(b // 8, b // 4)]) + m
-    )
+    a = clamp(h)
+    r = Hint(h[b // 8:b // 4] + m)
     R = scalarmult_B(r)
     S = (r + Hint(encodepoint(R) + pk + m) * a) % l
     return encodepoint(R) + encodeint(S)
@@ -263,13 +483,15 @@ def isoncurve(P):
 
 
 def decodeint(s):
-    return sum(2 ** i * bit(s, i) for i in range(0, b))
+    return int.from_bytes(s[:b // 8], "little")
 
 
 def decodepoint(s):
-    y = sum(2 ** i * bit(s, i) for i in range(0, b - 1))
+    y = decodeint(s)
+    sign = y >> (b - 1)
+    y &= (1 << (b - 1)) - 1
     x = xrecover(y)
-    if x & 1 != bit(s, b-1):
+    if x & 1 != sign:
         x = q - x
     P = (x, y, 1, (x*y) % q)
     if not isoncurve(P):
@@ -277,12 +499,58 @@ def decodepoint(s):
     return P
 
 
+# Bounded LRU of decodepoint results, see set_decodepoint_cache_size.
+_decodepoint_lru = lru_cache(maxsize=1024)(decodepoint)
+
+
+def decodepoint_cached(s):
+    """
+    decodepoint through a bounded LRU cache, for public keys and xpublic
+    keys that get decoded over and over again.
+    """
+    return _decodepoint_lru(bytes(s[:b // 8]))
+
+
+def decodepoint_cache_info():
+    """
+    Hits, misses, maxsize and currsize of the decodepoint_cached LRU.
+    """
+    return _decodepoint_lru.cache_info()
+
+
+def decodepoint_cache_clear():
+    _decodepoint_lru.cache_clear()
+
+
+def set_decodepoint_cache_size(maxsize):
+    """
+    Resize the decodepoint_cached LRU to maxsize points, 0 disables it and
+    None makes it unbounded. The cached points and counters are dropped.
+    """
+    global _decodepoint_lru
+    _decodepoint_lru = lru_cache(maxsize=maxsize)(decodepoint)
+
+
+def scalar_reduce(s):
+    """
+    Reduce a little-endian byte string of any length modulo l and return
+    the 32 byte encoding of the result.
+    """
+    return encodeint(int.from_bytes(s, "little") % l)
+
+
+def scalar_muladd(a, _b, c):
+    """
+    (a * b + c) mod l over 32 byte little-endian scalars.
+    """
+    return encodeint(
+        (int.from_bytes(a, "little") * int.from_bytes(_b, "little") +
+         int.from_bytes(c, "little")) % l
+    )
+
+
 def hex2int(_hex):
-    unhex = unhexlify(_hex)
-    s = 0
-    for i in range(len(unhex)):
-        s += 256 ** i * unhex[i]
-    return s
+    return int.from_bytes(unhexlify(_hex), "little")
 
 
 def int2hex(_int):
@@ -290,19 +558,11 @@ def int2hex(_int):
 
 
 def sc_reduce32(inputs):
-    _int = hex2int(inputs)
-    modulo = _int % l
-    return int2hex(modulo)
+    return hexlify(scalar_reduce(unhexlify(inputs)))
 
 
 def sc_muladd(a, _b, c):
-    a_int = hex2int(a)
-    b_int = hex2int(_b)
-    c_int = hex2int(c)
-
-    s = a_int * b_int + c_int
-    modulo = s % l
-    return int2hex(modulo)
+    return hexlify(scalar_muladd(unhexlify(a), unhexlify(_b), unhexlify(c)))
 
 
 class SignatureMismatch(Exception):
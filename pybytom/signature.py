@@ -1,13 +1,92 @@
 #!/usr/bin/env python3
 
+from collections import (
+    OrderedDict, namedtuple
+)
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import (
+    Iterable, List, Optional, Tuple
+)
+
 import hashlib
 import ed25519
 import hmac
+import secrets
+import threading
 
-from .wallet.tools import get_xpublic_key
 from .libs.ed25519 import (
-    sc_reduce32, decodeint, scalarmultbase, encodepoint, sc_muladd
+    q, l, decodeint, decodepoint, decodepoint_cached, encodepoint, scalarmultbase, edwards_add, edwards_double,
+    edwards_neg, multiscalarmult, make_comb_table, scalarmult_comb
 )
+from .libs.backends import get_backend
+
+
+class Signer:
+    """
+    Bytom message signer bound to one private key.
+
+    It computes the expanded secret and the public key once, so signing many messages
+    by the same key only costs one base point multiply per message.
+
+    :param private_key: Bytom private key.
+    :type private_key: str.
+    :returns: Signer -- Bytom signer instance.
+
+    >>> from pybytom.signature import Signer
+    >>> signer = Signer(private_key="e07af52746e7cccd0a7d1fba6651a6f474bada481f34b1c5bab5e2d71e36ee515803ee0a6682fb19e279d8f4f7acebee8abd0fc74771c71565f9a9643fd77141")
+    >>> signer.sign(message="1246b84985e1ab5f83f4ec2bdf271114666fd3d9e24d12981a3c861b9ed523c6")
+    "f6624fea84fadccbc1bc72dc384f662468e271c4e32d846bc0a1524470549992c8ffcc3ca43891a30de4235392b0868c506ed254f0f77cc1f2b9c1a2385ddb05"
+    """
+
+    def __init__(self, private_key: str):
+        backend = get_backend()
+        private_bytes = bytes.fromhex(private_key)
+        expand_bytes = hmac.HMAC(
+            b"Expand", private_bytes, digestmod=hashlib.sha512).digest()
+        self._secret, self._prefix = private_bytes[:32], expand_bytes[32:]
+        self._public_bytes: bytes = backend.encode_point(backend.scalarmult_base(self._secret))
+
+    def public_key(self) -> str:
+        """
+        Get Bytom public key of signer.
+
+        :return: str -- Bytom public key.
+        """
+
+        return self._public_bytes.hex()
+
+    def sign(self, message: str) -> str:
+        """
+        Sign Bytom message data by the signer private key.
+
+        :param message: Message data.
+        :type message: str.
+        :return: str -- Bytom signed message or signature.
+        """
+
+        backend = get_backend()
+        message_bytes = bytes.fromhex(message)
+
+        message_digest = backend.scalar_reduce(hashlib.sha512(self._prefix + message_bytes).digest())
+        encoded_r = backend.encode_point(backend.scalarmult_base(message_digest))
+        hram_digest = backend.scalar_reduce(
+            hashlib.sha512(encoded_r + self._public_bytes + message_bytes).digest())
+
+        s = backend.scalar_muladd(hram_digest, self._secret, message_digest)
+        signature_bytes = encoded_r + s
+        return signature_bytes.hex()
+
+    def sign_many(self, messages: Iterable[str]) -> List[str]:
+        """
+        Sign many Bytom message datas by the signer private key.
+
+        :param messages: Message datas.
+        :type messages: list.
+        :return: list -- Bytom signatures, in the order of messages.
+        """
+
+        return [self.sign(message) for message in messages]
 
 
 def sign(private_key: str, message: str) -> str:
@@ -25,39 +104,71 @@ def sign(private_key: str, message: str) -> str:
     "f6624fea84fadccbc1bc72dc384f662468e271c4e32d846bc0a1524470549992c8ffcc3ca43891a30de4235392b0868c506ed254f0f77cc1f2b9c1a2385ddb05"
     """
 
-    hc_hexstr = hmac.HMAC(
-        b"Expand", bytes.fromhex(private_key),
-        digestmod=hashlib.sha512).hexdigest()
-    private = private_key[:64] + hc_hexstr[64:]
-    private_bytes = bytes.fromhex(private)
-    message_bytes = bytes.fromhex(message)
-    data_bytes = private_bytes[32:64] + message_bytes
-
-    message_digest = hashlib.sha512(data_bytes).digest()
-    message_digest = sc_reduce32(message_digest.hex().encode())
-    message_digest = bytes.fromhex(message_digest.decode())
-    message_digest_reduced = message_digest[0:32]
-
-    scalar = decodeint(message_digest_reduced)
-    encoded_r = encodepoint(scalarmultbase(scalar))
-    public = get_xpublic_key(private)
-    public_bytes = bytes.fromhex(public)
-    hram_digest_data = (
-        encoded_r + public_bytes[:32] + message_bytes
-    )
-    hram_digest = hashlib.sha512(hram_digest_data).digest()
-    hram_digest = sc_reduce32(hram_digest.hex().encode())
-    hram_digest = bytes.fromhex(hram_digest.decode())
-    hram_digest_reduced = hram_digest[0:32]
+    return Signer(private_key=private_key).sign(message=message)
 
-    sk = private_bytes[:32]
-    s = sc_muladd(hram_digest_reduced.hex().encode(),
-                  sk.hex().encode(), message_digest_reduced.hex().encode())
-    s = bytes.fromhex(s.decode())
 
-    signature_bytes = encoded_r + s
-    signature = signature_bytes.hex()
-    return signature
+# Signers of a sign_many_parallel worker process by private key, never used in the calling
+# process, where the signers only live as long as the call.
+_signers: "OrderedDict[str, Signer]" = OrderedDict()
+_SIGNERS_SIZE: int = 128
+
+
+def _sign_chunk(chunk: List[Tuple[str, str]], signers: "Optional[OrderedDict[str, Signer]]" = None) -> List[str]:
+    if signers is None:
+        signers = _signers
+    signatures: List[str] = []
+    for private_key, message in chunk:
+        if private_key in signers:
+            signers.move_to_end(private_key)
+        else:
+            signers[private_key] = Signer(private_key=private_key)
+            if len(signers) > _SIGNERS_SIZE:
+                signers.popitem(last=False)
+        signatures.append(signers[private_key].sign(message=message))
+    return signatures
+
+
+def sign_many_parallel(jobs: Iterable[Tuple[str, str]], workers: Optional[int] = None,
+                       chunk_size: int = 256) -> List[str]:
+    """
+    Sign many Bytom message datas on a pool of processes.
+
+    Jobs are grouped by private key and cut into chunks, so each worker expands a key once
+    per chunk at most and keeps a few of them around for its next chunks. Signing inline,
+    with one worker or one chunk, keeps no expanded key after the call returns.
+
+    :param jobs: Bytom private key and message data pairs.
+    :type jobs: list.
+    :param workers: Number of worker processes, default to the number of processors.
+    :type workers: int.
+    :param chunk_size: Number of jobs sent to a worker at once, default to 256.
+    :type chunk_size: int.
+    :return: list -- Bytom signatures, in the order of jobs.
+
+    >>> from pybytom.signature import sign_many_parallel
+    >>> sign_many_parallel([("e07af52746e7cccd0a7d1fba6651a6f474bada481f34b1c5bab5e2d71e36ee515803ee0a6682fb19e279d8f4f7acebee8abd0fc74771c71565f9a9643fd77141", "1246b84985e1ab5f83f4ec2bdf271114666fd3d9e24d12981a3c861b9ed523c6")], workers=4)
+    ["f6624fea84fadccbc1bc72dc384f662468e271c4e32d846bc0a1524470549992c8ffcc3ca43891a30de4235392b0868c506ed254f0f77cc1f2b9c1a2385ddb05"]
+    """
+
+    jobs = list(jobs)
+    order = sorted(range(len(jobs)), key=lambda position: jobs[position][0])
+    chunks = [
+        [jobs[position] for position in order[start:start + chunk_size]]
+        for start in range(0, len(jobs), chunk_size)
+    ]
+
+    if workers == 1 or len(chunks) <= 1:
+        results = map(partial(_sign_chunk, signers=OrderedDict()), chunks)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_sign_chunk, chunks))
+
+    signatures: List[str] = [""] * len(jobs)
+    positions = iter(order)
+    for chunk in results:
+        for signature in chunk:
+            signatures[next(positions)] = signature
+    return signatures
 
 
 def verify(public_key: str, message: str, signature: str) -> bool:
@@ -77,6 +188,10 @@ def verify(public_key: str, message: str, signature: str) -> bool:
     True
     """
 
+    key = _verify_cache_get(public_key, message, signature) if _verify_cache_size else None
+    if key is True:
+        return True
+
     result = False
     verifying_key = ed25519.VerifyingKey(
         public_key.encode(), encoding="hex"
@@ -89,4 +204,220 @@ def verify(public_key: str, message: str, signature: str) -> bool:
         result = True
     except ed25519.BadSignatureError:
         result = False
+
+    if result and key is not None:
+        _verify_cache_put(key)
     return result
+
+
+VerifyCacheInfo = namedtuple("VerifyCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+# Bounded cache of verified signatures in front of verify, disabled until set_verify_cache_size.
+_verify_cache: "OrderedDict[bytes, bool]" = OrderedDict()
+_verify_cache_size: int = 0
+_verify_cache_hits: int = 0
+_verify_cache_misses: int = 0
+_verify_cache_lock = threading.Lock()
+
+
+def _verify_cache_get(public_key: str, message: str, signature: str):
+    # True on a hit, otherwise the key to put the triple under once verified
+    global _verify_cache_hits, _verify_cache_misses
+    public_bytes, signature_bytes = bytes.fromhex(public_key), bytes.fromhex(signature)
+    key = hashlib.sha256(
+        len(public_bytes).to_bytes(2, "little") + public_bytes +
+        len(signature_bytes).to_bytes(2, "little") + signature_bytes + bytes.fromhex(message)
+    ).digest()
+    with _verify_cache_lock:
+        if key in _verify_cache:
+            _verify_cache.move_to_end(key)
+            _verify_cache_hits += 1
+            return True
+        _verify_cache_misses += 1
+    return key
+
+
+def _verify_cache_put(key: bytes) -> None:
+    with _verify_cache_lock:
+        _verify_cache[key] = True
+        while len(_verify_cache) > _verify_cache_size:
+            _verify_cache.popitem(last=False)
+
+
+def set_verify_cache_size(maxsize: int) -> None:
+    """
+    Enable the verified signature cache of verify for up to maxsize signatures, 0 disables it.
+    Shrinking drops the least recently used signatures, disabling drops them all.
+
+    :param maxsize: Number of verified signatures to remember.
+    :type maxsize: int.
+
+    >>> from pybytom.signature import set_verify_cache_size
+    >>> set_verify_cache_size(100_000)
+    """
+
+    global _verify_cache_size
+    if maxsize < 0:
+        raise ValueError("Verify cache size must be 0 or more.")
+    with _verify_cache_lock:
+        _verify_cache_size = maxsize
+        while len(_verify_cache) > _verify_cache_size:
+            _verify_cache.popitem(last=False)
+
+
+def verify_cache_info() -> VerifyCacheInfo:
+    """
+    Get hits, misses, maxsize and currsize of the verified signature cache.
+
+    :return: VerifyCacheInfo -- verified signature cache statistics.
+
+    >>> from pybytom.signature import verify_cache_info
+    >>> verify_cache_info()
+    VerifyCacheInfo(hits=2, misses=1, maxsize=100000, currsize=1)
+    """
+
+    with _verify_cache_lock:
+        return VerifyCacheInfo(
+            _verify_cache_hits, _verify_cache_misses, _verify_cache_size, len(_verify_cache)
+        )
+
+
+def verify_cache_clear() -> None:
+    """
+    Drop every verified signature and reset the statistics of the verified signature cache.
+    """
+
+    global _verify_cache_hits, _verify_cache_misses
+    with _verify_cache_lock:
+        _verify_cache.clear()
+        _verify_cache_hits = _verify_cache_misses = 0
+
+
+class Verifier:
+    """
+    Bytom signature verifier bound to one public key.
+
+    It decodes the public key once and keeps a windowed multiple table of it, so every
+    verification costs one fixed-base multiply and a 64 step table walk. Building the
+    table costs about as much as several verifications, use it for keys that verify many.
+
+    :param public_key: Bytom public key.
+    :type public_key: str.
+    :returns: Verifier -- Bytom verifier instance.
+
+    >>> from pybytom.signature import Verifier
+    >>> verifier = Verifier(public_key="91ff7f525ff40874c4f47f0cab42e46e3bf53adad59adef9558ad1b6448f22e2")
+    >>> verifier.verify(message="1246b84985e1ab5f83f4ec2bdf271114666fd3d9e24d12981a3c861b9ed523c6", signature="f6624fea84fadccbc1bc72dc384f662468e271c4e32d846bc0a1524470549992c8ffcc3ca43891a30de4235392b0868c506ed254f0f77cc1f2b9c1a2385ddb05")
+    True
+    """
+
+    def __init__(self, public_key: str):
+        self._public_bytes: bytes = bytes.fromhex(public_key)
+        if len(self._public_bytes) != 32:
+            raise ValueError("Invalid public key length.")
+        # comb table of -A, since R == S * B - h * A
+        self._table: list = make_comb_table(edwards_neg(decodepoint_cached(self._public_bytes)))
+
+    def public_key(self) -> str:
+        """
+        Get Bytom public key of verifier.
+
+        :return: str -- Bytom public key.
+        """
+
+        return self._public_bytes.hex()
+
+    def verify(self, message: str, signature: str) -> bool:
+        """
+        Verify Bytom signature by the verifier public key.
+
+        :param message: Message data.
+        :type message: str.
+        :param signature: Signed message data.
+        :type signature: str.
+        :return: bool -- verified signature.
+        """
+
+        signature_bytes = bytes.fromhex(signature)
+        if len(signature_bytes) != 64 or signature_bytes[63] & 224:
+            return False
+        hram_digest = hashlib.sha512(
+            signature_bytes[:32] + self._public_bytes + bytes.fromhex(message)).digest()
+        R = edwards_add(
+            scalarmultbase(decodeint(signature_bytes[32:])),
+            scalarmult_comb(self._table, int.from_bytes(hram_digest, "little") % l)
+        )
+        return encodepoint(R) == signature_bytes[:32]
+
+
+def _decode_batch_entry(public_key: str, message: str, signature: str) -> tuple:
+    public_bytes, message_bytes, signature_bytes = (
+        bytes.fromhex(public_key), bytes.fromhex(message), bytes.fromhex(signature)
+    )
+    if len(public_bytes) != 32 or len(signature_bytes) != 64 or signature_bytes[63] & 224:
+        raise ValueError("Invalid public key or signature length.")
+    R, A = decodepoint(signature_bytes[:32]), decodepoint_cached(public_bytes)
+    # verify compares R to a canonical encoding, so reject the non-canonical ones
+    if R[1] >= q or (R[0] % q == 0 and signature_bytes[31] >> 7):
+        raise ValueError("Non-canonical R encoding.")
+    hram_digest = hashlib.sha512(signature_bytes[:32] + public_bytes + message_bytes).digest()
+    return R, A, decodeint(signature_bytes[32:]), int.from_bytes(hram_digest, "little") % l
+
+
+def _batch_equation(entries: List[tuple]) -> bool:
+    # 8 * (sum(z * S) * B - sum(z * R) - sum(z * h * A)) == 0 for random 128-bit z
+    scalars, points, s_sum = [], [], 0
+    for R, A, S, h in entries:
+        z = secrets.randbits(128)
+        s_sum += z * S
+        scalars += [z, z * h % l]
+        points += [edwards_neg(R), edwards_neg(A)]
+    P = edwards_add(scalarmultbase(s_sum % l), multiscalarmult(scalars, points))
+    P = edwards_double(edwards_double(edwards_double(P)))
+    return P[0] % q == 0 and (P[1] - P[2]) % q == 0
+
+
+def verify_batch(entries: Iterable[Tuple[str, str, str]]) -> List[bool]:
+    """
+    Verify many Bytom signatures at once.
+
+    Valid signatures are checked together with one random linear combination of their
+    verification equations, then any batch that fails is split in halves until the bad
+    entries are found, single entries included. The equation is cofactored, so the result
+    of an entry doesn't depend on the batch it's in, and it's the same as verify gives for
+    every signature made by the Bytom signer. Only a signature crafted with a small order
+    component in its public key or R can be accepted here and rejected by verify.
+
+    :param entries: Bytom public key, message data and signature triples.
+    :type entries: list.
+    :return: list -- verified signature of each entry, in the given order.
+
+    >>> from pybytom.signature import verify_batch
+    >>> verify_batch([("91ff7f525ff40874c4f47f0cab42e46e3bf53adad59adef9558ad1b6448f22e2", "1246b84985e1ab5f83f4ec2bdf271114666fd3d9e24d12981a3c861b9ed523c6", "f6624fea84fadccbc1bc72dc384f662468e271c4e32d846bc0a1524470549992c8ffcc3ca43891a30de4235392b0868c506ed254f0f77cc1f2b9c1a2385ddb05")])
+    [True]
+    """
+
+    entries = list(entries)
+    results: List[bool] = [False] * len(entries)
+
+    decoded: list = []
+    for position, (public_key, message, signature) in enumerate(entries):
+        try:
+            decoded.append((position, _decode_batch_entry(public_key, message, signature)))
+        except ValueError:
+            pass
+
+    def bisect(batch: list, failed: bool = False) -> bool:
+        # failed batches aren't checked again, when the left half of a failed batch passes
+        # the right half fails for sure
+        if not failed and _batch_equation([entry for _, entry in batch]):
+            for position, _ in batch:
+                results[position] = True
+            return True
+        if len(batch) > 1:
+            bisect(batch[len(batch) // 2:], failed=bisect(batch[:len(batch) // 2]))
+        return False
+
+    if decoded:
+        bisect(decoded)
+    return results
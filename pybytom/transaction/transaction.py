@@ -3,6 +3,7 @@
 from typing import (Optional, List)
 
 from ..wallet import Wallet
+from ..signature import Signer
 from ..wallet.tools import (
     indexes_to_path, get_program, get_address
 )
@@ -274,7 +275,6 @@ class Transaction:
         elif not private_key and xprivate_key:
             wallet.from_xprivate_key(xprivate_key=xprivate_key)
         for signing_instruction in self.unsigned_datas(detail=True):
-            signed_data: list = []
             unsigned_datas = signing_instruction["datas"]
             if not private_key and signing_instruction["path"]:
                 wallet.from_path(signing_instruction["path"])
@@ -284,8 +284,7 @@ class Transaction:
                 wallet.from_path(path)
             elif not private_key and indexes:
                 wallet.from_indexes(indexes)
-            for unsigned_data in unsigned_datas:
-                signed_data.append(wallet.sign(unsigned_data))
+            signed_data = Signer(private_key=wallet.private_key()).sign_many(unsigned_datas)
             self._signatures.append(signed_data)
             wallet.clean_derivation()
         return self
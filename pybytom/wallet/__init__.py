@@ -3,19 +3,41 @@
 from typing import List
 
 from .wallet import (
-    Wallet, DEFAULT_PATH, DEFAULT_BIP44, DEFAULT_INDEXES
+    Wallet, WalletView, DEFAULT_PATH, DEFAULT_BIP44, DEFAULT_INDEXES, DUMPS_FIELDS
+)
+from .keys import (
+    ExtendedPrivateKey, ExtendedPublicKey
+)
+from .cache import (
+    DerivationCache, derivation_cache
 )
 from .tools import (
     get_xpublic_key, get_expand_xprivate_key, get_child_xprivate_key, indexes_to_path,
-    get_child_xpublic_key, get_address, get_program, get_private_key,
-    get_public_key, get_bytes, path_to_indexes
+    get_child_xpublic_key, get_child_xpublic_keys, get_address, get_program, get_private_key,
+    get_public_key, get_bytes, path_to_indexes, iter_addresses, get_change_xpublic_key,
+    get_child_addresses, get_child_xkeys
+)
+from .bulk import (
+    generate_addresses, generate_programs, write_addresses, import_wallets, ImportedWallet
+)
+from .index import ProgramIndex
+from .watch_only import (
+    WatchOnlyWallet, WatchOnlyWallets
+)
+from .discovery import (
+    DiscoveredAddress, discover, discover_chain
 )
 
 
 __all__: List[str] = [
-    "Wallet", "DEFAULT_PATH", "DEFAULT_BIP44", "DEFAULT_INDEXES",
+    "Wallet", "WalletView", "DEFAULT_PATH", "DEFAULT_BIP44", "DEFAULT_INDEXES", "DUMPS_FIELDS",
     "get_xpublic_key", "get_expand_xprivate_key", "get_child_xprivate_key",
-    "get_child_xpublic_key", "get_address", "get_program",
+    "get_child_xpublic_key", "get_child_xpublic_keys", "get_child_xkeys", "get_address", "get_program",
     "get_private_key", "get_public_key", "get_bytes",
-    "indexes_to_path", "path_to_indexes"
+    "indexes_to_path", "path_to_indexes", "DerivationCache", "derivation_cache",
+    "iter_addresses", "get_change_xpublic_key", "get_child_addresses",
+    "generate_addresses", "generate_programs", "write_addresses", "import_wallets", "ImportedWallet",
+    "ProgramIndex",
+    "DiscoveredAddress", "discover", "discover_chain", "ExtendedPrivateKey", "ExtendedPublicKey",
+    "WatchOnlyWallet", "WatchOnlyWallets"
 ]
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+
+from collections import (
+    deque, namedtuple
+)
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import (
+    Callable, Iterable, Iterator, List, Optional, Tuple, Union
+)
+
+import csv
+import os
+import struct
+
+from .wallet import (
+    Wallet, DEFAULT_PATH
+)
+from .keys import ExtendedPublicKey
+from .tools import (
+    get_change_xpublic_key, get_child_addresses, get_program, get_bytes
+)
+from ..exceptions import NetworkError
+from ..utils import is_network
+from ..config import config
+
+# Binary address record: little-endian index, public key and control program.
+RECORD: struct.Struct = struct.Struct("<I32s22s")
+
+ImportedWallet = namedtuple("ImportedWallet", [
+    "position", "xpublic_key", "path", "public_key", "program", "address", "error"
+])
+
+
+def _address_chunk(chunk: Tuple[str, int, int, str, bool]) -> List[Tuple[int, str, str, str]]:
+    xpublic_key, start, stop, network, vapor = chunk
+    return get_child_addresses(
+        xpublic_key=xpublic_key, start=start, stop=stop, network=network, vapor=vapor
+    )
+
+
+def _program_chunk(chunk: Tuple[str, int, int]) -> List[Tuple[int, str]]:
+    xpublic_key, start, stop = chunk
+    indexes = range(start, stop)
+    child_xpublic_keys = ExtendedPublicKey.from_hex(xpublic_key).children(
+        [int(index).to_bytes(4, byteorder="little") for index in indexes]
+    )
+    return [
+        (index, get_program(public_key=child_xpublic_key.public_key().hex()))
+        for index, child_xpublic_key in zip(indexes, child_xpublic_keys)
+    ]
+
+
+def _ordered_map(function: Callable, chunks: Iterable, workers: Optional[int] = None,
+                 inline: bool = False) -> Iterator:
+    # results of function over chunks in order, keeping at most two chunks per worker in flight
+    if workers == 1 or inline:
+        yield from map(function, chunks)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pending = deque()
+    try:
+        for chunk in chunks:
+            pending.append(executor.submit(function, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def _check_range(start: int, stop: Optional[int], chunk_size: int) -> int:
+    # stop of the address range, all non-hardened indexes when None
+    stop = config["harden"] if stop is None else stop
+    if not 0 <= start <= stop <= config["harden"]:
+        raise ValueError("Invalid address range, indexes must be 0 <= start <= stop <= 2**31.")
+    if chunk_size < 1:
+        raise ValueError("Invalid chunk size, it must be 1 or more.")
+    return stop
+
+
+def _generate(function: Callable, change_xpublic_key: str, start: int, stop: int, workers: Optional[int],
+              chunk_size: int, *args) -> Iterator:
+    chunks = (
+        (change_xpublic_key, index, min(index + chunk_size, stop), *args)
+        for index in range(start, stop, chunk_size)
+    )
+    for results in _ordered_map(function, chunks, workers=workers, inline=stop - start <= chunk_size):
+        yield from results
+
+
+def generate_addresses(xpublic_key: str, account: int = 1, change: int = 0, start: int = 0,
+                       stop: Optional[int] = None, network: str = config["network"], vapor: bool = config["vapor"],
+                       workers: Optional[int] = None, chunk_size: int = 1_024) -> Iterator[Tuple[int, str, str, str]]:
+    """
+    Generate Bytom addresses of an account on a pool of processes.
+
+    The change xpublic key is derived once, then workers only get it with an index range
+    and derive their chunk of addresses. Results are streamed back in index order, keeping
+    at most two chunks per worker in flight. Arguments are checked when called, before the
+    first address is asked for.
+
+    :param xpublic_key: Bytom root xpublic key.
+    :type xpublic_key: str
+    :param account: Bytom BIP44 account index, default to 1.
+    :type account: int
+    :param change: Bytom BIP44 change index, default to 0.
+    :type change: int
+    :param start: Bytom first address index, default to 0.
+    :type start: int
+    :param stop: Bytom address index to stop before, default to None (all non-hardened indexes).
+    :type stop: int
+    :param network: Bytom network, default to mainnet.
+    :type network: str
+    :param vapor: Bytom sidechain vapor, defaults to False.
+    :type vapor: bool
+    :param workers: Number of worker processes, default to the number of processors.
+    :type workers: int
+    :param chunk_size: Number of addresses sent to a worker at once, default to 1024.
+    :type chunk_size: int
+
+    :return: iterator -- Bytom (index, public key, program, address) tuples.
+
+    >>> from pybytom.wallet.bulk import generate_addresses
+    >>> for index, public_key, program, address in generate_addresses("16476b7fd68ca2acd92cfc38fa353e75d6103f828276f44d587e660a6bd7a5c5ef4490504bd2b6f997113671892458830de09518e6bd5958d5d5dd97624cfa4b", start=1, stop=2, workers=4):
+    ...     print(index, public_key, program, address)
+    1 91ff7f525ff40874c4f47f0cab42e46e3bf53adad59adef9558ad1b6448f22e2 00142cda4f99ea8112e6fa61cdd26157ed6dc408332a bm1q9ndylx02syfwd7npehfxz4lddhzqsve2fu6vc7
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid '{network}' network",
+                           "choose only 'mainnet', 'solonet' or 'testnet' networks.")
+    stop = _check_range(start=start, stop=stop, chunk_size=chunk_size)
+
+    change_xpublic_key = get_change_xpublic_key(
+        xpublic_key=xpublic_key, account=account, change=change
+    )
+    return _generate(
+        _address_chunk, change_xpublic_key, start, stop, workers, chunk_size, network, vapor
+    )
+
+
+def generate_programs(xpublic_key: str, account: int = 1, change: int = 0, start: int = 0,
+                      stop: Optional[int] = None, workers: Optional[int] = None,
+                      chunk_size: int = 1_024) -> Iterator[Tuple[int, str]]:
+    """
+    Generate Bytom control programs of an account on a pool of processes.
+
+    Same as generate_addresses without the public keys and the bech32 addresses, for
+    callers that only match programs.
+
+    :param xpublic_key: Bytom root xpublic key.
+    :type xpublic_key: str
+
+    Other arguments are the same with generate_addresses function.
+
+    :return: iterator -- Bytom (index, program) tuples.
+
+    >>> from pybytom.wallet.bulk import generate_programs
+    >>> list(generate_programs("16476b7fd68ca2acd92cfc38fa353e75d6103f828276f44d587e660a6bd7a5c5ef4490504bd2b6f997113671892458830de09518e6bd5958d5d5dd97624cfa4b", start=1, stop=2))
+    [(1, "00142cda4f99ea8112e6fa61cdd26157ed6dc408332a")]
+    """
+
+    stop = _check_range(start=start, stop=stop, chunk_size=chunk_size)
+
+    change_xpublic_key = get_change_xpublic_key(
+        xpublic_key=xpublic_key, account=account, change=change
+    )
+    return _generate(_program_chunk, change_xpublic_key, start, stop, workers, chunk_size)
+
+
+def write_addresses(file_path: str, xpublic_key: str, account: int = 1, change: int = 0, start: int = 0,
+                    stop: Optional[int] = None, network: str = config["network"], vapor: bool = config["vapor"],
+                    workers: Optional[int] = None, chunk_size: int = 1_024, binary: bool = False) -> int:
+    """
+    Write Bytom addresses of an account generated on a pool of processes to a file.
+
+    CSV files get an index, public_key, program, address header then a row per address.
+    Binary files get a 58 bytes record per address, the little-endian 32-bit index, the
+    public key and the control program, see RECORD. Addresses are left out of binary
+    records, they are the bech32 encoding of the program for the network. Arguments are
+    checked before the file is opened, so a bad call leaves an existing file as it was.
+
+    :param file_path: File path to write to.
+    :type file_path: str
+    :param xpublic_key: Bytom root xpublic key.
+    :type xpublic_key: str
+    :param binary: Write binary records instead of CSV, default to False.
+    :type binary: bool
+
+    Other arguments are the same with generate_addresses function.
+
+    :return: int -- Number of written addresses.
+
+    >>> from pybytom.wallet.bulk import write_addresses
+    >>> write_addresses("addresses.csv", "16476b7fd68ca2acd92cfc38fa353e75d6103f828276f44d587e660a6bd7a5c5ef4490504bd2b6f997113671892458830de09518e6bd5958d5d5dd97624cfa4b", stop=10_000)
+    10000
+    """
+
+    # generate_addresses checks its arguments before the file is opened and truncated
+    addresses = generate_addresses(
+        xpublic_key=xpublic_key, account=account, change=change, start=start, stop=stop,
+        network=network, vapor=vapor, workers=workers, chunk_size=chunk_size
+    )
+    count: int = 0
+    if binary:
+        with open(file_path, "wb") as file:
+            for index, public_key, program, address in addresses:
+                file.write(RECORD.pack(index, get_bytes(public_key), get_bytes(program)))
+                count += 1
+    else:
+        with open(file_path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["index", "public_key", "program", "address"])
+            for row in addresses:
+                writer.writerow(row)
+                count += 1
+    return count
+
+
+def _import_chunk(chunk: List[Tuple[int, Union[str, Tuple[str, Optional[str]]]]], path: str,
+                  network: str, vapor: bool, from_seed: bool) -> List[ImportedWallet]:
+    imported: List[ImportedWallet] = []
+    for position, secret in chunk:
+        try:
+            wallet: Wallet = Wallet(network=network)
+            if from_seed:
+                wallet.from_seed(seed=secret)
+            else:
+                mnemonic, passphrase = secret
+                wallet.from_mnemonic(mnemonic=mnemonic, passphrase=passphrase)
+            wallet.from_path(path=path)
+            imported.append(ImportedWallet(
+                position, wallet.xpublic_key(), path, wallet.public_key(), wallet.program(),
+                wallet.address(vapor=vapor), None
+            ))
+        except ValueError as error:
+            # invalid mnemonics and seeds (binascii.Error is a ValueError), anything else is a bug
+            # and propagates. Only the error type leaves the worker, its message may quote the secret
+            imported.append(ImportedWallet(position, None, path, None, None, None, type(error).__name__))
+    return imported
+
+
+def _import_wallets(secrets: Iterable[Union[str, Tuple[str, Optional[str]]]], path: str, network: str,
+                    vapor: bool, from_seed: bool, workers: Optional[int], chunk_size: int) -> Iterator[ImportedWallet]:
+    positions = enumerate(secrets)
+    chunks = iter(lambda: list(islice(positions, chunk_size)), [])
+    for imported in _ordered_map(partial(
+        _import_chunk, path=path, network=network, vapor=vapor, from_seed=from_seed
+    ), chunks, workers=workers):
+        yield from imported
+
+
+def import_wallets(secrets: Iterable[Union[str, Tuple[str, Optional[str]]]], path: str = DEFAULT_PATH,
+                   network: str = config["network"], vapor: bool = config["vapor"], from_seed: bool = False,
+                   workers: Optional[int] = None, chunk_size: int = 16) -> Iterator[ImportedWallet]:
+    """
+    Import Bytom wallets from mnemonics or seeds on a pool of processes.
+
+    Seed stretching and derivation run in the workers and only public data comes back, in
+    the order of secrets. A secret that can't be imported, an invalid mnemonic or seed that
+    raises ValueError, gives an ImportedWallet with just its position and error type name,
+    no message that could quote it. Any other error is raised. Arguments are checked when
+    called, before the first secret is read.
+
+    :param secrets: Bytom (mnemonic, passphrase) pairs, or seed hex strings with from_seed.
+    :type secrets: list
+    :param path: Bytom derivation path, default to DEFAULT_PATH.
+    :type path: str
+    :param network: Bytom network, default to mainnet.
+    :type network: str
+    :param vapor: Bytom sidechain vapor, defaults to False.
+    :type vapor: bool
+    :param from_seed: Secrets are seed hex strings, default to False.
+    :type from_seed: bool
+    :param workers: Number of worker processes, default to the number of processors.
+    :type workers: int
+    :param chunk_size: Number of secrets sent to a worker at once, default to 16.
+    :type chunk_size: int
+
+    :return: iterator -- Bytom imported wallets, in the order of secrets.
+
+    >>> from pybytom.wallet.bulk import import_wallets
+    >>> for imported_wallet in import_wallets([("indicate warm sock mistake code spot acid ribbon sing over taxi toast", None)], workers=4):
+    ...     print(imported_wallet.position, imported_wallet.address, imported_wallet.error)
+    0 bm1q9ndylx02syfwd7npehfxz4lddhzqsve2fu6vc7 None
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid '{network}' network",
+                           "choose only 'mainnet', 'solonet' or 'testnet' networks.")
+    if chunk_size < 1:
+        raise ValueError("Invalid chunk size, it must be 1 or more.")
+
+    return _import_wallets(
+        secrets, path=path, network=network, vapor=vapor, from_seed=from_seed, workers=workers,
+        chunk_size=chunk_size
+    )
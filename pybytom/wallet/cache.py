@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+
+from collections import (
+    OrderedDict, namedtuple
+)
+from typing import (
+    Optional, Tuple
+)
+
+import threading
+
+DerivationCacheInfo = namedtuple("DerivationCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class DerivationCache:
+    """
+    Bytom derivation cache of intermediate extended keys.
+
+    Nodes are keyed by their kind (xprivate or xpublic), the extended key they were derived
+    from and the index prefix of the derivation, and evicted least recently used first.
+    Each node takes about 500 bytes, so the default of 4096 nodes stays around 2 MB.
+
+    Only xpublic nodes are cached unless private is set, since xprivate nodes are secrets
+    that would outlive the wallets they came from. Xprivate nodes are keyed by the SHA-256
+    digest of their parent key, and they stay in memory until evicted, clear is called or
+    private is unset.
+
+    :param maxsize: Number of nodes to keep, 0 disables the cache, default to 4096.
+    :type maxsize: int
+    :param private: Also cache xprivate nodes, default to False.
+    :type private: bool
+    :returns: DerivationCache -- Bytom derivation cache instance.
+
+    >>> from pybytom.wallet.cache import derivation_cache
+    >>> derivation_cache.info()
+    DerivationCacheInfo(hits=4, misses=1, maxsize=4096, currsize=5)
+    >>> derivation_cache.clear()
+    """
+
+    def __init__(self, maxsize: int = 4096, private: bool = False):
+        if maxsize < 0:
+            raise ValueError("Derivation cache size must be 0 or more.")
+        self._maxsize: int = maxsize
+        self._private: bool = private
+        self._nodes: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+
+    def get(self, kind: str, key: bytes, indexes: Tuple[bytes, ...]) -> Tuple[int, Optional[bytes]]:
+        """
+        Get the deepest cached node along indexes, as its depth and extended key bytes,
+        or (0, None) if none is cached.
+        """
+
+        if not self._maxsize or not indexes or (kind == "xprivate" and not self._private):
+            return 0, None
+        with self._lock:
+            for depth in range(len(indexes), 0, -1):
+                node = self._nodes.get((kind, key, indexes[:depth]))
+                if node is not None:
+                    self._nodes.move_to_end((kind, key, indexes[:depth]))
+                    self._hits += 1
+                    return depth, node
+            self._misses += 1
+        return 0, None
+
+    def put(self, kind: str, key: bytes, indexes: Tuple[bytes, ...], node: bytes) -> None:
+        """
+        Put the extended key bytes derived from key along indexes.
+        """
+
+        if not self._maxsize or (kind == "xprivate" and not self._private):
+            return
+        with self._lock:
+            self._nodes[(kind, key, indexes)] = node
+            self._nodes.move_to_end((kind, key, indexes))
+            while len(self._nodes) > self._maxsize:
+                self._nodes.popitem(last=False)
+
+    def resize(self, maxsize: int) -> None:
+        """
+        Change the number of nodes to keep, dropping the least recently used ones.
+        """
+
+        if maxsize < 0:
+            raise ValueError("Derivation cache size must be 0 or more.")
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._nodes) > self._maxsize:
+                self._nodes.popitem(last=False)
+
+    def set_private(self, private: bool) -> None:
+        """
+        Start or stop caching xprivate nodes, stopping drops the cached ones.
+        """
+
+        with self._lock:
+            self._private = private
+            if not private:
+                for node_key in [node_key for node_key in self._nodes if node_key[0] == "xprivate"]:
+                    del self._nodes[node_key]
+
+    def clear(self) -> None:
+        """
+        Drop every node, xprivate ones included, and reset the statistics.
+        """
+
+        with self._lock:
+            self._nodes.clear()
+            self._hits = self._misses = 0
+
+    def info(self) -> DerivationCacheInfo:
+        """
+        Get hits, misses, maxsize and currsize of the cache.
+        """
+
+        with self._lock:
+            return DerivationCacheInfo(self._hits, self._misses, self._maxsize, len(self._nodes))
+
+
+# Derivation cache used by the wallet tools, and so by Wallet and Transaction.
+derivation_cache: DerivationCache = DerivationCache()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from itertools import (
+    count, islice
+)
+from typing import (
+    Iterable, List, Optional
+)
+
+from ..config import config
+from ..rpc import (
+    get_balance, get_utxos
+)
+from .tools import iter_addresses
+
+DiscoveredAddress = namedtuple("DiscoveredAddress", [
+    "account", "change", "index", "path", "address", "program", "balance", "utxos"
+])
+
+
+def _query(executor: ThreadPoolExecutor, address: str, program: str, asset: str, network: str,
+           vapor: bool, utxos: bool, headers: dict, timeout: int):
+    balance = executor.submit(
+        get_balance, address=address, asset=asset, network=network, vapor=vapor,
+        headers=headers, timeout=timeout
+    )
+    outputs = executor.submit(
+        get_utxos, program=program, network=network, asset=asset, vapor=vapor,
+        headers=headers, timeout=timeout
+    ) if utxos else None
+    return balance, outputs
+
+
+def discover_chain(executor: ThreadPoolExecutor, xpublic_key: str, account: int = 1, change: int = 0,
+                   gap_limit: int = 20, network: str = config["network"], vapor: bool = config["vapor"],
+                   asset: str = config["asset"], utxos: bool = False, headers: dict = config["headers"],
+                   timeout: int = config["timeout"]) -> List[DiscoveredAddress]:
+    """
+    Discover Bytom used addresses of an account change chain.
+
+    Addresses are derived and queried gap limit at a time on the executor threads, and the
+    scan stops once gap limit addresses in a row are unused. An address is used when it
+    has a balance or, if utxos are queried, unspent outputs.
+
+    :param executor: Thread pool that runs the queries.
+    :type executor: ThreadPoolExecutor
+    :param xpublic_key: Bytom root xpublic key.
+    :type xpublic_key: str
+    :param account: Bytom BIP44 account index, default to 1.
+    :type account: int
+    :param change: Bytom BIP44 change index, default to 0.
+    :type change: int
+    :param gap_limit: Number of unused addresses in a row that ends the chain, default to 20.
+    :type gap_limit: int
+
+    Other arguments are the same with discover function.
+
+    :return: list -- Bytom discovered addresses, in index order.
+
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> from pybytom.wallet.discovery import discover_chain
+    >>> with ThreadPoolExecutor(max_workers=8) as executor:
+    ...     discover_chain(executor, "16476b7fd68ca2acd92cfc38fa353e75d6103f828276f44d587e660a6bd7a5c5ef4490504bd2b6f997113671892458830de09518e6bd5958d5d5dd97624cfa4b", network="mainnet")
+    [DiscoveredAddress(account=1, change=0, index=1, path='m/44/153/1/0/1', address='bm1q9ndylx02syfwd7npehfxz4lddhzqsve2fu6vc7', program='00142cda4f99ea8112e6fa61cdd26157ed6dc408332a', balance=71560900, utxos=None)]
+    """
+
+    if gap_limit < 1:
+        raise ValueError("Invalid gap limit, it must be 1 or more.")
+
+    addresses = iter_addresses(
+        xpublic_key=xpublic_key, account=account, change=change, network=network,
+        vapor=vapor, chunk_size=gap_limit
+    )
+    discovered: List[DiscoveredAddress] = []
+    unused: int = 0
+    while unused < gap_limit:
+        batch = list(islice(addresses, gap_limit))
+        if not batch:
+            break
+        queries = [
+            _query(executor, address, program, asset, network, vapor, utxos, headers, timeout)
+            for index, public_key, program, address in batch
+        ]
+        for (index, public_key, program, address), (balance, outputs) in zip(batch, queries):
+            balance, outputs = balance.result(), outputs.result() if outputs else None
+            if balance or outputs:
+                discovered.append(DiscoveredAddress(
+                    account, change, index, config["BIP44"].format(
+                        account=account, change=change, address=index
+                    ), address, program, balance, outputs
+                ))
+                unused = 0
+            else:
+                unused += 1
+                if unused >= gap_limit:
+                    break
+    return discovered
+
+
+def discover(xpublic_key: str, account: int = 1, changes: Iterable[int] = (0, 1), gap_limit: int = 20,
+             max_accounts: Optional[int] = None, network: str = config["network"],
+             vapor: bool = config["vapor"], asset: str = config["asset"], utxos: bool = False,
+             workers: int = 8, headers: dict = config["headers"],
+             timeout: int = config["timeout"]) -> List[DiscoveredAddress]:
+    """
+    Discover Bytom used addresses of an xpublic key by BIP44 gap limit scanning.
+
+    Accounts are scanned from account up, and the scan stops at the first account with no
+    used address on any of its change chains.
+
+    :param xpublic_key: Bytom root xpublic key.
+    :type xpublic_key: str
+    :param account: Bytom BIP44 first account index, default to 1.
+    :type account: int
+    :param changes: Bytom BIP44 change indexes to scan, default to (0, 1).
+    :type changes: tuple
+    :param gap_limit: Number of unused addresses in a row that ends a chain, default to 20.
+    :type gap_limit: int
+    :param max_accounts: Number of accounts to scan at most, default to None (no limit).
+    :type max_accounts: int
+    :param network: Bytom network, default to mainnet.
+    :type network: str
+    :param vapor: Bytom sidechain vapor, defaults to False.
+    :type vapor: bool
+    :param asset: Bytom asset id, defaults to BTM asset.
+    :type asset: str
+    :param utxos: Also query unspent outputs of addresses, default to False.
+    :type utxos: bool
+    :param workers: Number of concurrent queries, default to 8.
+    :type workers: int
+    :param headers: Request headers, default to common headers.
+    :type headers: dict
+    :param timeout: Request timeout, default to 60.
+    :type timeout: int
+
+    :return: list -- Bytom discovered addresses, by account, change and index.
+
+    >>> from pybytom.wallet.discovery import discover
+    >>> discover("16476b7fd68ca2acd92cfc38fa353e75d6103f828276f44d587e660a6bd7a5c5ef4490504bd2b6f997113671892458830de09518e6bd5958d5d5dd97624cfa4b", network="mainnet")
+    [DiscoveredAddress(account=1, change=0, index=1, path='m/44/153/1/0/1', address='bm1q9ndylx02syfwd7npehfxz4lddhzqsve2fu6vc7', program='00142cda4f99ea8112e6fa61cdd26157ed6dc408332a', balance=71560900, utxos=None)]
+    """
+
+    discovered: List[DiscoveredAddress] = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        accounts = count(account) if max_accounts is None else range(account, account + max_accounts)
+        for account in accounts:
+            used: List[DiscoveredAddress] = []
+            for change in changes:
+                used.extend(discover_chain(
+                    executor, xpublic_key=xpublic_key, account=account, change=change,
+                    gap_limit=gap_limit, network=network, vapor=vapor, asset=asset, utxos=utxos,
+                    headers=headers, timeout=timeout
+                ))
+            if not used:
+                break
+            discovered.extend(used)
+    return discovered
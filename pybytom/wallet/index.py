@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Optional, Tuple
+)
+
+import sqlite3
+
+from .bulk import generate_programs
+from .tools import get_bytes
+from ..config import config
+
+
+class ProgramIndex:
+    """
+    Bytom reverse index from control program to derivation path of an xpublic key.
+
+    Program hashes are kept in an SQLite table keyed by the 20 bytes hash, so a lookup is
+    a single B-tree search. The index only grows, extend derives the programs after the
+    last indexed one of an account change.
+
+    :param xpublic_key: Bytom root xpublic key.
+    :type xpublic_key: str
+    :param file_path: SQLite database file path, default to ":memory:".
+    :type file_path: str
+    :returns: ProgramIndex -- Bytom program index instance.
+
+    >>> from pybytom.wallet.index import ProgramIndex
+    >>> program_index = ProgramIndex("16476b7fd68ca2acd92cfc38fa353e75d6103f828276f44d587e660a6bd7a5c5ef4490504bd2b6f997113671892458830de09518e6bd5958d5d5dd97624cfa4b", "programs.db")
+    >>> program_index.extend(stop=20)
+    20
+    >>> program_index.lookup("00142cda4f99ea8112e6fa61cdd26157ed6dc408332a")
+    "m/44/153/1/0/1"
+    """
+
+    def __init__(self, xpublic_key: str, file_path: str = ":memory:"):
+        self._xpublic_key: str = xpublic_key
+        self._connection = sqlite3.connect(file_path)
+        self._connection.executescript(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS programs ("
+            "hash BLOB PRIMARY KEY, account INTEGER NOT NULL, change INTEGER NOT NULL, "
+            "address INTEGER NOT NULL) WITHOUT ROWID;"
+            "CREATE INDEX IF NOT EXISTS programs_path ON programs (account, change, address);"
+        )
+        row = self._connection.execute("SELECT value FROM meta WHERE key = 'xpublic_key'").fetchone()
+        if row is None:
+            with self._connection:
+                self._connection.execute(
+                    "INSERT INTO meta (key, value) VALUES ('xpublic_key', ?)", (xpublic_key,)
+                )
+        elif row[0] != xpublic_key:
+            self._connection.close()
+            raise ValueError("Invalid program index file, it was built from another xpublic key.")
+
+    def next_index(self, account: int = 1, change: int = 0) -> int:
+        """
+        Get the first address index not indexed yet of an account change.
+
+        :param account: Bytom BIP44 account index, default to 1.
+        :type account: int
+        :param change: Bytom BIP44 change index, default to 0.
+        :type change: int
+
+        :return: int -- Bytom address index.
+
+        >>> program_index.next_index()
+        20
+        """
+
+        row = self._connection.execute(
+            "SELECT MAX(address) FROM programs WHERE account = ? AND change = ?", (account, change)
+        ).fetchone()
+        return 0 if row[0] is None else row[0] + 1
+
+    def extend(self, stop: int, account: int = 1, change: int = 0, workers: Optional[int] = 1,
+               chunk_size: int = 1_024) -> int:
+        """
+        Index the addresses of an account change up to stop.
+
+        :param stop: Bytom address index to stop before.
+        :type stop: int
+        :param account: Bytom BIP44 account index, default to 1.
+        :type account: int
+        :param change: Bytom BIP44 change index, default to 0.
+        :type change: int
+        :param workers: Number of worker processes, default to 1.
+        :type workers: int
+        :param chunk_size: Number of addresses derived and inserted together, default to 1024.
+        :type chunk_size: int
+
+        :return: int -- Number of newly indexed addresses.
+
+        >>> program_index.extend(stop=40)
+        20
+        """
+
+        start = self.next_index(account=account, change=change)
+        if stop <= start:
+            return 0
+        rows = (
+            (get_bytes(program[4:]), account, change, index)
+            for index, program in generate_programs(
+                xpublic_key=self._xpublic_key, account=account, change=change, start=start,
+                stop=stop, workers=workers, chunk_size=chunk_size
+            )
+        )
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO programs (hash, account, change, address) VALUES (?, ?, ?, ?)", rows
+            )
+        return stop - start
+
+    def lookup(self, program: str) -> Optional[str]:
+        """
+        Lookup derivation path of a control program.
+
+        :param program: Bytom control program.
+        :type program: str
+
+        :return: str -- Bytom derivation path, None if it's not indexed.
+
+        >>> program_index.lookup("00142cda4f99ea8112e6fa61cdd26157ed6dc408332a")
+        "m/44/153/1/0/1"
+        """
+
+        row: Optional[Tuple[int, int, int]] = self._connection.execute(
+            "SELECT account, change, address FROM programs WHERE hash = ?", (get_bytes(program[4:]),)
+        ).fetchone()
+        if row is None:
+            return None
+        return config["BIP44"].format(account=row[0], change=row[1], address=row[2])
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM programs").fetchone()[0]
+
+    def close(self) -> None:
+        """
+        Close the SQLite database.
+        """
+
+        self._connection.close()
+
+    def __enter__(self) -> "ProgramIndex":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
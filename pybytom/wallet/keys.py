@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+
+from typing import (
+    List, Sequence
+)
+
+import hmac
+import hashlib
+
+from ..libs.ed25519 import (
+    encodeint, decodeint
+)
+from ..libs.backends import get_backend
+from ..exceptions import DerivationError
+from .cache import derivation_cache
+from .utils import (
+    prune_intermediate_scalar, get_bytes, bad_seed_checker
+)
+
+
+class ExtendedPublicKey:
+    """
+    Bytom extended public key, the 32 bytes public key followed by the 32 bytes chain code.
+
+    The decoded public point is cached, so deriving many children of the same key decodes
+    it once.
+
+    :param key: Bytom xpublic key bytes.
+    :type key: bytes
+    :returns: ExtendedPublicKey -- Bytom extended public key instance.
+
+    >>> from pybytom.wallet.keys import ExtendedPublicKey
+    >>> xpublic_key = ExtendedPublicKey.from_hex("16476b7fd68ca2acd92cfc38fa353e75d6103f828276f44d587e660a6bd7a5c5ef4490504bd2b6f997113671892458830de09518e6bd5958d5d5dd97624cfa4b")
+    >>> xpublic_key.derive([b"\\x2c\\x00\\x00\\x00", b"\\x99\\x00\\x00\\x00", b"\\x01\\x00\\x00\\x00", b"\\x00\\x00\\x00\\x00", b"\\x01\\x00\\x00\\x00"]).public_key().hex()
+    "91ff7f525ff40874c4f47f0cab42e46e3bf53adad59adef9558ad1b6448f22e2"
+    """
+
+    __slots__ = ("_key", "_point")
+
+    def __init__(self, key: bytes):
+        if len(key) != 64:
+            raise ValueError("Invalid xpublic key, it must be 64 bytes.")
+        self._key: bytes = bytes(key)
+        # (backend, point) of the public key, decoded on first use
+        self._point = None
+
+    @classmethod
+    def from_hex(cls, xpublic_key: str) -> "ExtendedPublicKey":
+        return cls(get_bytes(xpublic_key))
+
+    def public_key(self) -> bytes:
+        return self._key[:32]
+
+    def chain_code(self) -> bytes:
+        return self._key[32:]
+
+    def point(self):
+        """
+        Get the decoded public point, in the representation of the current ed25519 backend.
+        """
+
+        backend = get_backend()
+        if self._point is None or self._point[0] is not backend:
+            self._point = (backend, backend.decode_point(self._key[:32]))
+        return self._point[1]
+
+    def _child_point(self, index: bytes):
+        i = hmac.HMAC(self._key[32:],
+                      b"N" + self._key[:32] + index,
+                      digestmod=hashlib.sha512).digest()
+        il, ir = i[:32], i[32:]
+        bad_seed_checker(il)
+
+        backend = get_backend()
+        f = backend.scalarmult_base(bytes(prune_intermediate_scalar(il)))
+        return backend.point_add(self.point(), f), ir
+
+    def child(self, index: bytes) -> "ExtendedPublicKey":
+        """
+        Derive the child of a 4 bytes little-endian index.
+        """
+
+        p, ir = self._child_point(index)
+        return ExtendedPublicKey(get_backend().encode_point(p) + ir)
+
+    def children(self, indexes: Sequence[bytes]) -> List["ExtendedPublicKey"]:
+        """
+        Derive the children of many sibling indexes, encoding their points in one batch.
+        """
+
+        points, chain_codes = [], []
+        for index in indexes:
+            p, ir = self._child_point(index)
+            points.append(p)
+            chain_codes.append(ir)
+        return [
+            ExtendedPublicKey(public_key + chain_code)
+            for public_key, chain_code in zip(get_backend().encode_points(points), chain_codes)
+        ]
+
+    def derive(self, indexes: Sequence[bytes]) -> "ExtendedPublicKey":
+        """
+        Derive along indexes, starting from the deepest node of the derivation cache.
+        """
+
+        indexes = tuple(indexes)
+        start, node = derivation_cache.get("xpublic", self._key, indexes)
+        xpublic_key = self if node is None else ExtendedPublicKey(node)
+        for depth in range(start, len(indexes)):
+            xpublic_key = xpublic_key.child(indexes[depth])
+            derivation_cache.put("xpublic", self._key, indexes[:depth + 1], xpublic_key._key)
+        return xpublic_key
+
+    def hex(self) -> str:
+        return self._key.hex()
+
+    def __bytes__(self) -> bytes:
+        return self._key
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ExtendedPublicKey) and self._key == other._key
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __repr__(self) -> str:
+        return f"ExtendedPublicKey({self._key.hex()!r})"
+
+
+class ExtendedPrivateKey:
+    """
+    Bytom extended private key, the 32 bytes scalar followed by the 32 bytes chain code.
+
+    The public point is carried along derivation, a child gets it by adding the tweak times
+    the base point to its parent point, so the child xpublic key comes from the same pass.
+
+    :param key: Bytom xprivate key bytes.
+    :type key: bytes
+    :returns: ExtendedPrivateKey -- Bytom extended private key instance.
+
+    >>> from pybytom.wallet.keys import ExtendedPrivateKey
+    >>> xprivate_key = ExtendedPrivateKey.from_hex("205b15f70e253399da90b127b074ea02904594be9d54678207872ec1ba31ee51ef4490504bd2b6f997113671892458830de09518e6bd5958d5d5dd97624cfa4b")
+    >>> xprivate_key.xpublic_key().hex()
+    "16476b7fd68ca2acd92cfc38fa353e75d6103f828276f44d587e660a6bd7a5c5ef4490504bd2b6f997113671892458830de09518e6bd5958d5d5dd97624cfa4b"
+    """
+
+    __slots__ = ("_key", "_point", "_public_key")
+
+    def __init__(self, key: bytes):
+        if len(key) != 64:
+            raise ValueError("Invalid xprivate key, it must be 64 bytes.")
+        self._key: bytes = bytes(key)
+        # (backend, point) of the public key, carried from the parent or computed on first use
+        self._point = None
+        self._public_key = None
+
+    @classmethod
+    def from_hex(cls, xprivate_key: str) -> "ExtendedPrivateKey":
+        return cls(get_bytes(xprivate_key))
+
+    def point(self):
+        """
+        Get the public point, in the representation of the current ed25519 backend.
+        """
+
+        backend = get_backend()
+        if self._point is None or self._point[0] is not backend:
+            self._point = (backend, backend.scalarmult_base(self._key[:32]))
+        return self._point[1]
+
+    def public_key(self) -> bytes:
+        if self._public_key is None:
+            self._public_key = get_backend().encode_point(self.point())
+        return self._public_key
+
+    def chain_code(self) -> bytes:
+        return self._key[32:]
+
+    def xpublic_key(self) -> ExtendedPublicKey:
+        return ExtendedPublicKey(self.public_key() + self._key[32:])
+
+    def child(self, index: bytes) -> "ExtendedPrivateKey":
+        """
+        Derive the child of a 4 bytes little-endian index.
+        """
+
+        i = hmac.HMAC(self._key[32:],
+                      b"N" + self.public_key() + index,
+                      digestmod=hashlib.sha512).digest()
+        il, ir = i[:32], i[32:]
+        bad_seed_checker(il)
+
+        f = prune_intermediate_scalar(il)
+        total = decodeint(self._key[:32]) + decodeint(f)
+        if (total >> 256) != 0:
+            # Bytom chainkd refuses to truncate the carry too
+            raise DerivationError("Bad xprivate key", "child scalar does not fit in 256-bit int.")
+        child = ExtendedPrivateKey(encodeint(total) + ir)
+
+        # child point is parent point + f * B, carrying the public chain along the private one
+        backend = get_backend()
+        child._point = (backend, backend.point_add(self.point(), backend.scalarmult_base(bytes(f))))
+        return child
+
+    def derive(self, indexes: Sequence[bytes]) -> "ExtendedPrivateKey":
+        """
+        Derive along indexes, starting from the deepest node of the derivation cache if it
+        caches xprivate nodes.
+        """
+
+        # the cache skips xprivate nodes unless set private, and never keeps the parent key
+        indexes, key = tuple(indexes), hashlib.sha256(self._key).digest()
+        start, node = derivation_cache.get("xprivate", key, indexes)
+        xprivate_key = self if node is None else ExtendedPrivateKey(node)
+        for depth in range(start, len(indexes)):
+            xprivate_key = xprivate_key.child(indexes[depth])
+            derivation_cache.put("xprivate", key, indexes[:depth + 1], xprivate_key._key)
+        return xprivate_key
+
+    def hex(self) -> str:
+        return self._key.hex()
+
+    def __bytes__(self) -> bytes:
+        return self._key
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ExtendedPrivateKey) and self._key == other._key
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __repr__(self) -> str:
+        return "ExtendedPrivateKey(...)"
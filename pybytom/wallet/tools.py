@@ -1,16 +1,18 @@
 #!/usr/bin/env python3
 
-from typing import Optional, List
+from typing import (
+    Optional, List, Iterator, Tuple
+)
 
 import hmac
 import hashlib
 
 from ..libs.segwit import encode
-from ..libs.ed25519 import (
-    encodepoint, decodepoint, decodeint, scalarmultbase, edwards_add
+from .keys import (
+    ExtendedPrivateKey, ExtendedPublicKey
 )
 from .utils import (
-    prune_intermediate_scalar, get_bytes, bad_seed_checker
+    get_bytes, bad_seed_checker
 )
 from ..exceptions import NetworkError
 from ..utils import is_network
@@ -31,11 +33,7 @@ def get_xpublic_key(xprivate_key: str) -> str:
     "16476b7fd68ca2acd92cfc38fa353e75d6103f828276f44d587e660a6bd7a5c5ef4490504bd2b6f997113671892458830de09518e6bd5958d5d5dd97624cfa4b"
     """
 
-    xprivate_bytes = get_bytes(xprivate_key)
-    scalar = decodeint(xprivate_bytes[:len(xprivate_bytes) // 2])
-    buf = encodepoint(scalarmultbase(scalar))
-    xpublic_key = buf + xprivate_bytes[len(xprivate_bytes) // 2:]
-    return xpublic_key.hex()
+    return ExtendedPrivateKey.from_hex(xprivate_key).xpublic_key().hex()
 
 
 def get_expand_xprivate_key(xprivate_key: str) -> str:
@@ -137,31 +135,11 @@ def get_child_xprivate_key(xprivate_key: str, indexes: Optional[List[str]] = Non
     elif path is not None:
         indexes = path_to_indexes(path=path)
 
-    for index in range(len(indexes)):
-        index_bytes = get_bytes(indexes[index])
-        xpublic_key = get_xpublic_key(xprivate_key=xprivate_key)
-        xpublic_bytes = get_bytes(xpublic_key)
-        xprivate_bytes = get_bytes(xprivate_key)
-        i = bytearray(hmac.HMAC(xpublic_bytes[32:],
-                                b"N" + xpublic_bytes[:32] + index_bytes,
-                                digestmod=hashlib.sha512).digest())
-        il, ir = i[:32], i[32:]
-        bad_seed_checker(il)
-
-        i = prune_intermediate_scalar(il)[:32] + ir
-
-        carry = 0
-        total = 0
-        for _i in range(32):
-            total = xprivate_bytes[_i] + i[_i] + carry
-            i[_i] = total & 0xff
-            carry = total >> 8
-        if (total >> 8) != 0:
-            print("sum does not fit in 256-bit int")
-        xprivate_key = i.hex()
-
-    child_xprivate = xprivate_key
-    return child_xprivate
+    if not indexes:
+        return xprivate_key
+    return ExtendedPrivateKey.from_hex(xprivate_key).derive(
+        [get_bytes(index) for index in indexes]
+    ).hex()
 
 
 def get_child_xpublic_key(xpublic_key, indexes: Optional[List[str]] = None,
@@ -188,29 +166,74 @@ def get_child_xpublic_key(xpublic_key, indexes: Optional[List[str]] = None,
     elif path is not None:
         indexes = path_to_indexes(path=path)
 
-    for index in range(len(indexes)):
-        index_bytes = get_bytes(indexes[index])
-        xpublic_bytes = get_bytes(xpublic_key)
-        i = bytearray(hmac.HMAC(xpublic_bytes[32:],
-                                b"N" + xpublic_bytes[:32] + index_bytes,
-                                digestmod=hashlib.sha512).digest())
+    if not indexes:
+        return xpublic_key
+    return ExtendedPublicKey.from_hex(xpublic_key).derive(
+        [get_bytes(index) for index in indexes]
+    ).hex()
+
+
+def get_child_xkeys(xprivate_key: str, indexes: Optional[List[str]] = None,
+                    path: Optional[str] = None) -> Tuple[str, str]:
+    """
+    Get Bytom child xprivate and xpublic keys in one derivation pass.
+
+    :param xprivate_key: Bytom xprivate key.
+    :type xprivate_key: str
+    :param indexes: Bytom derivation indexes, default to None.
+    :type indexes: list
+    :param path: Bytom derivation path, default to None.
+    :type path: str
+
+    :return: tuple -- Bytom child xprivate key and child xpublic key.
+
+    >>> from pybytom.wallet.tools import get_child_xkeys
+    >>> get_child_xkeys("205b15f70e253399da90b127b074ea02904594be9d54678207872ec1ba31ee51ef4490504bd2b6f997113671892458830de09518e6bd5958d5d5dd97624cfa4b", path="m/44/153/1/0/1")
+    ("e07af52746e7cccd0a7d1fba6651a6f474bada481f34b1c5bab5e2d71e36ee515803ee0a6682fb19e279d8f4f7acebee8abd0fc74771c71565f9a9643fd77141", "91ff7f525ff40874c4f47f0cab42e46e3bf53adad59adef9558ad1b6448f22e25803ee0a6682fb19e279d8f4f7acebee8abd0fc74771c71565f9a9643fd77141")
+    """
+
+    if indexes is None and path is None:
+        indexes = []
+    elif path is not None:
+        indexes = path_to_indexes(path=path)
+
+    child_xprivate_key = ExtendedPrivateKey.from_hex(xprivate_key).derive(
+        [get_bytes(index) for index in indexes]
+    )
+    return child_xprivate_key.hex(), child_xprivate_key.xpublic_key().hex()
 
-        il, ir = i[:32], i[32:]
-        bad_seed_checker(il)
 
-        f = bytes(prune_intermediate_scalar(il))
-        scalar = decodeint(f)
-        f = scalarmultbase(scalar)
+def get_child_xpublic_keys(xpublic_key: str, children: List[str], indexes: Optional[List[str]] = None,
+                           path: Optional[str] = None) -> List[str]:
+    """
+    Get Bytom child xpublic keys of many sibling indexes at once.
 
-        p = decodepoint(xpublic_bytes[:32])
-        p = edwards_add(p, f)
-        public_key = encodepoint(p)
+    :param xpublic_key: Bytom xpublic key.
+    :type xpublic_key: str
+    :param children: Bytom child derivation indexes, derived next to each other under the parent.
+    :type children: list
+    :param indexes: Bytom derivation indexes of the parent, default to None.
+    :type indexes: list
+    :param path: Bytom derivation path of the parent, default to None.
+    :type path: str
 
-        xpublic_bytes = public_key[:32] + ir
-        xpublic_key = xpublic_bytes.hex()
+    :return: list -- Bytom child xpublic keys, in the order of children.
 
-    child_xpublic = xpublic_key
-    return child_xpublic
+    >>> from pybytom.wallet.tools import get_child_xpublic_keys
+    >>> get_child_xpublic_keys("16476b7fd68ca2acd92cfc38fa353e75d6103f828276f44d587e660a6bd7a5c5ef4490504bd2b6f997113671892458830de09518e6bd5958d5d5dd97624cfa4b", ["00000000", "01000000"], path="m/44/153/1/0")
+    ["400844a6bb707ffeb8e4cf32db219778dab1e7bee70e730f430e079997b947bee9678523fb7dc99b949a4032cb998a16881b9e648445d7c6a39197f63b0d5741", "91ff7f525ff40874c4f47f0cab42e46e3bf53adad59adef9558ad1b6448f22e25803ee0a6682fb19e279d8f4f7acebee8abd0fc74771c71565f9a9643fd77141"]
+    """
+
+    if indexes is None and path is None:
+        indexes = []
+    elif path is not None:
+        indexes = path_to_indexes(path=path)
+
+    return [
+        child_xpublic_key.hex() for child_xpublic_key in ExtendedPublicKey.from_hex(xpublic_key).derive(
+            [get_bytes(index) for index in indexes]
+        ).children([get_bytes(index) for index in children])
+    ]
 
 
 def get_private_key(xprivate_key: str, indexes: Optional[List[str]] = None,
@@ -315,3 +338,116 @@ def get_address(program: str, network: str = config["network"], vapor: bool = co
         return encode("sp", 0, get_bytes(program[4:]))
     elif network == "testnet" and vapor:
         return encode("tp", 0, get_bytes(program[4:]))
+
+
+def iter_addresses(xpublic_key: str, account: int = 1, change: int = 0, start: int = 0,
+                   stop: Optional[int] = None, network: str = config["network"],
+                   vapor: bool = config["vapor"], chunk_size: int = 256) -> Iterator[Tuple[int, str, str, str]]:
+    """
+    Iterate Bytom addresses of an account from xpublic key.
+
+    :param xpublic_key: Bytom root xpublic key.
+    :type xpublic_key: str
+    :param account: Bytom BIP44 account index, default to 1.
+    :type account: int
+    :param change: Bytom BIP44 change index, default to 0.
+    :type change: int
+    :param start: Bytom first address index, default to 0.
+    :type start: int
+    :param stop: Bytom address index to stop before, default to None (all non-hardened indexes).
+    :type stop: int
+    :param network: Bytom network, default to mainnet.
+    :type network: str
+    :param vapor: Bytom sidechain vapor, defaults to False.
+    :type vapor: bool
+    :param chunk_size: Number of addresses derived and encoded together, default to 256.
+    :type chunk_size: int
+
+    :return: iterator -- Bytom (index, public key, program, address) tuples.
+
+    >>> from pybytom.wallet.tools import iter_addresses
+    >>> for index, public_key, program, address in iter_addresses("16476b7fd68ca2acd92cfc38fa353e75d6103f828276f44d587e660a6bd7a5c5ef4490504bd2b6f997113671892458830de09518e6bd5958d5d5dd97624cfa4b", start=1, stop=2):
+    ...     print(index, public_key, program, address)
+    1 91ff7f525ff40874c4f47f0cab42e46e3bf53adad59adef9558ad1b6448f22e2 00142cda4f99ea8112e6fa61cdd26157ed6dc408332a bm1q9ndylx02syfwd7npehfxz4lddhzqsve2fu6vc7
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid '{network}' network",
+                           "choose only 'mainnet', 'solonet' or 'testnet' networks.")
+    stop = config["harden"] if stop is None else stop
+    if not 0 <= start <= stop <= config["harden"]:
+        raise ValueError("Invalid address range, indexes must be 0 <= start <= stop <= 2**31.")
+    if chunk_size < 1:
+        raise ValueError("Invalid chunk size, it must be 1 or more.")
+
+    # derive the change node once, addresses are its direct children
+    change_xpublic_key = get_change_xpublic_key(
+        xpublic_key=xpublic_key, account=account, change=change
+    )
+    for index in range(start, stop, chunk_size):
+        yield from get_child_addresses(
+            xpublic_key=change_xpublic_key, start=index, stop=min(index + chunk_size, stop),
+            network=network, vapor=vapor
+        )
+
+
+def get_change_xpublic_key(xpublic_key: str, account: int = 1, change: int = 0) -> str:
+    """
+    Get Bytom BIP44 change xpublic key of an account, the parent of its addresses.
+
+    :param xpublic_key: Bytom root xpublic key.
+    :type xpublic_key: str
+    :param account: Bytom BIP44 account index, default to 1.
+    :type account: int
+    :param change: Bytom BIP44 change index, default to 0.
+    :type change: int
+
+    :return: str -- Bytom change xpublic key.
+
+    >>> from pybytom.wallet.tools import get_change_xpublic_key
+    >>> get_change_xpublic_key("16476b7fd68ca2acd92cfc38fa353e75d6103f828276f44d587e660a6bd7a5c5ef4490504bd2b6f997113671892458830de09518e6bd5958d5d5dd97624cfa4b")
+    "5555c6eec52ceca808a3ee575be5fa38131506f04094c58343dce382054843aba815ae856d2efc70cd3f04db16507cf516afd0d45867f46aa92d802a9ad51037"
+    """
+
+    return get_child_xpublic_key(
+        xpublic_key=xpublic_key, path=config["BIP44"].rsplit("/", 1)[0].format(
+            account=account, change=change
+        )
+    )
+
+
+def get_child_addresses(xpublic_key: str, start: int, stop: int, network: str = config["network"],
+                        vapor: bool = config["vapor"]) -> List[Tuple[int, str, str, str]]:
+    """
+    Get Bytom addresses of the non-hardened children start up to stop of a change xpublic key.
+
+    :param xpublic_key: Bytom change xpublic key.
+    :type xpublic_key: str
+    :param start: Bytom first address index.
+    :type start: int
+    :param stop: Bytom address index to stop before.
+    :type stop: int
+    :param network: Bytom network, default to mainnet.
+    :type network: str
+    :param vapor: Bytom sidechain vapor, defaults to False.
+    :type vapor: bool
+
+    :return: list -- Bytom (index, public key, program, address) tuples.
+
+    >>> from pybytom.wallet.tools import get_child_addresses
+    >>> get_child_addresses("5555c6eec52ceca808a3ee575be5fa38131506f04094c58343dce382054843aba815ae856d2efc70cd3f04db16507cf516afd0d45867f46aa92d802a9ad51037", 1, 2)
+    [(1, "91ff7f525ff40874c4f47f0cab42e46e3bf53adad59adef9558ad1b6448f22e2", "00142cda4f99ea8112e6fa61cdd26157ed6dc408332a", "bm1q9ndylx02syfwd7npehfxz4lddhzqsve2fu6vc7")]
+    """
+
+    indexes = range(start, stop)
+    child_xpublic_keys = ExtendedPublicKey.from_hex(xpublic_key).children(
+        [int(index).to_bytes(4, byteorder="little") for index in indexes]
+    )
+    addresses: List[Tuple[int, str, str, str]] = []
+    for index, child_xpublic_key in zip(indexes, child_xpublic_keys):
+        public_key = child_xpublic_key.public_key().hex()
+        program = get_program(public_key=public_key)
+        addresses.append((index, public_key, program, get_address(
+            program=program, network=network, vapor=vapor
+        )))
+    return addresses
@@ -2,14 +2,16 @@
 
 from binascii import (hexlify, unhexlify)
 from mnemonic import Mnemonic
-from typing import (Optional, List)
+from collections.abc import Mapping
+from typing import (Optional, List, Tuple, Iterator)
 
+import copy
 import hmac
 import unicodedata
 import hashlib
 
 from ..config import config
-from ..signature import (sign, verify)
+from ..signature import (Signer, verify)
 from ..utils import (
     get_mnemonic_language, is_mnemonic, is_network, get_entropy_strength, get_mnemonic_strength
 )
@@ -21,8 +23,9 @@ from ..rpc import (
 )
 from .tools import (
     get_xpublic_key, get_address, get_program, get_child_xpublic_key, get_child_xprivate_key,
-    get_private_key, get_public_key, get_expand_xprivate_key
+    get_public_key, get_expand_xprivate_key, path_to_indexes
 )
+from .keys import ExtendedPrivateKey
 from .utils import (
     prune_root_scalar, get_bytes, bad_seed_checker
 )
@@ -65,6 +68,13 @@ class Wallet:
 
         self._indexes: List[str] = []
         self._path: Optional[str] = None
+        # xprivate key derived along indexes, carrying its public key, None until derived
+        self._node: Optional[ExtendedPrivateKey] = None
+
+        # derived values by name, cleared when the keys or the derivation change
+        self._memo: dict = {}
+        # wallets from child and at_path share state with their parent, so they are read-only
+        self._frozen: bool = False
 
     def from_entropy(self, entropy: str, passphrase: Optional[str] = None,
                      language: str = "english") -> "Wallet":
@@ -85,6 +95,8 @@ class Wallet:
         <pybytom.wallet.Wallet object at 0x040DA268>
         """
 
+        self._check_mutable()
+
         if language not in ["english", "french", "italian", "japanese",
                             "chinese_simplified", "chinese_traditional", "korean", "spanish"]:
             raise ValueError("Invalid language, choose only the following options 'english', 'french', 'italian', "
@@ -120,6 +132,8 @@ class Wallet:
         <pybytom.wallet.Wallet object at 0x040DA268>
         """
 
+        self._check_mutable()
+
         if language and language not in ["english", "french", "italian", "japanese",
                                          "chinese_simplified", "chinese_traditional", "korean", "spanish"]:
             raise ValueError("Invalid language, choose only the following options 'english', 'french', 'italian', "
@@ -153,6 +167,8 @@ class Wallet:
         <pybytom.wallet.Wallet object at 0x040DA268>
         """
 
+        self._check_mutable()
+
         self._seed = unhexlify(seed.encode())
         i = hmac.HMAC(b"Root", get_bytes(self._seed),
                       digestmod=hashlib.sha512).hexdigest()
@@ -161,7 +177,9 @@ class Wallet:
 
         # get root xprivate_key key
         self._xprivate_key = prune_root_scalar(il).hex() + ir
-        self._private_key = get_private_key(str(self._xprivate_key), self._indexes)
+        self._node = None
+        self._memo = {}
+        self.derivation()
         return self
 
     def from_xprivate_key(self, xprivate_key: str) -> "Wallet":
@@ -178,7 +196,11 @@ class Wallet:
         <pybytom.wallet.Wallet object at 0x040DA268>
         """
 
+        self._check_mutable()
+
         self._xprivate_key = xprivate_key
+        self._node = None
+        self._memo = {}
         return self
 
     def from_private_key(self, private_key: str) -> "Wallet":
@@ -195,18 +217,45 @@ class Wallet:
         <pybytom.wallet.Wallet object at 0x040DA268>
         """
 
+        self._check_mutable()
+
         self._private_key = private_key
+        self._node = None
+        self._memo = self._root_memo()
         return self
 
     def derivation(self, index: Optional[int] = None) -> "Wallet":
+        self._check_mutable()
         if index is not None:
             index = int(index).to_bytes(4, byteorder="little").hex()
             self._indexes.append(index)
         if not self._xprivate_key:
             raise DerivationError("You can't drive", "XPrivate Key is also None.")
-        self._private_key = get_private_key(str(self._xprivate_key), self._indexes)
+        if index is not None and self._node is not None:
+            # extend the current node by one level instead of re-deriving from the root
+            self._node = self._node.derive([get_bytes(index)])
+        else:
+            self._node = ExtendedPrivateKey.from_hex(str(self._xprivate_key)).derive(
+                [get_bytes(index) for index in self._indexes]
+            )
+        self._private_key = self._node.hex()
+        self._memo = self._root_memo()
         return self
 
+    def _check_mutable(self) -> None:
+        if self._frozen:
+            raise DerivationError("You can't change a derived wallet",
+                                  "call child or at_path on it to get another one.")
+
+    def _root_memo(self) -> dict:
+        # values of the xprivate key alone survive a derivation change
+        return {name: self._memo[name] for name in ["xpublic_key", "expand_xprivate_key"] if name in self._memo}
+
+    def _memoized(self, name, compute):
+        if name not in self._memo:
+            self._memo[name] = compute()
+        return self._memo[name]
+
     def from_indexes(self, indexes: List[str]) -> "Wallet":
         """
         Drive Bytom wallet from indexes.
@@ -222,6 +271,8 @@ class Wallet:
         <pybytom.wallet.Wallet object at 0x040DA268>
         """
 
+        self._check_mutable()
+
         self._indexes = indexes
         self.derivation()
         return self
@@ -247,6 +298,8 @@ class Wallet:
         <pybytom.wallet.Wallet object at 0x040DA268>
         """
 
+        self._check_mutable()
+
         if harden:
             self.derivation(index + 0x80000000)
         else:
@@ -268,6 +321,8 @@ class Wallet:
         <pybytom.wallet.Wallet object at 0x040DA268>
         """
 
+        self._check_mutable()
+
         if str(path)[0:2] != "m/":
             raise DerivationError("Bad path", "insert like this type of path \"m/0'/0\"! ")
 
@@ -278,6 +333,81 @@ class Wallet:
                 self.derivation(int(index))
         return self
 
+    def child(self, index: int, harden: bool = False) -> "Wallet":
+        """
+        Get a new Bytom wallet one derivation level below this one, leaving this wallet unchanged.
+
+        The child shares the keys and root values of this wallet and starts from its derived
+        node, so deriving siblings costs one derivation step each. It is read-only, its from_*
+        and derivation methods raise DerivationError.
+
+        :param index: Bytom derivation index.
+        :type index: int.
+        :param harden: BIP 32 key harden, default to False.
+        :type harden: bool.
+        :returns: Wallet -- Bytom child wallet instance.
+
+        >>> from pybytom.wallet import Wallet
+        >>> wallet = Wallet(network="mainnet")
+        >>> wallet.from_mnemonic("indicate warm sock mistake code spot acid ribbon sing over taxi toast")
+        >>> change = wallet.at_path("m/44/153/1/0")
+        >>> [change.child(index).address() for index in range(2)]
+        ["bm1qsd0uwnzppn7yquk0ta583uk672ra04tj98fr72", "bm1q9ndylx02syfwd7npehfxz4lddhzqsve2fu6vc7"]
+        """
+
+        if harden:
+            index += 0x80000000
+        index = int(index).to_bytes(4, byteorder="little").hex()
+        return self._fork(self._indexes + [index], self._current_node().derive([get_bytes(index)]))
+
+    def at_path(self, path: str) -> "Wallet":
+        """
+        Get a new Bytom wallet derived along path, leaving this wallet unchanged.
+
+        Paths below the current one start from its derived node, other paths from the root.
+        The new wallet is read-only like the ones of child.
+
+        :param path: Bytom derivation path.
+        :type path: str.
+        :returns: Wallet -- Bytom wallet instance.
+
+        >>> from pybytom.wallet import Wallet
+        >>> wallet = Wallet(network="mainnet")
+        >>> wallet.from_mnemonic("indicate warm sock mistake code spot acid ribbon sing over taxi toast")
+        >>> wallet.at_path("m/44/153/1/0/1").address()
+        "bm1q9ndylx02syfwd7npehfxz4lddhzqsve2fu6vc7"
+        """
+
+        if str(path)[0:2] != "m/":
+            raise DerivationError("Bad path", "insert like this type of path \"m/0'/0\"! ")
+
+        indexes = path_to_indexes(path=path)
+        if indexes[:len(self._indexes)] == self._indexes:
+            node = self._current_node().derive([get_bytes(index) for index in indexes[len(self._indexes):]])
+        else:
+            node = self._current_node(root=True).derive([get_bytes(index) for index in indexes])
+        return self._fork(indexes, node)
+
+    def _current_node(self, root: bool = False) -> ExtendedPrivateKey:
+        if not self._xprivate_key:
+            raise DerivationError("You can't drive", "XPrivate Key is also None.")
+        root_node = ExtendedPrivateKey.from_hex(str(self._xprivate_key))
+        if root:
+            return root_node
+        return self._node if self._node is not None else root_node.derive(
+            [get_bytes(index) for index in self._indexes]
+        )
+
+    def _fork(self, indexes: List[str], node: ExtendedPrivateKey) -> "Wallet":
+        # shallow copy shares the keys and root values, only the derivation state is new
+        wallet = copy.copy(self)
+        wallet._indexes = indexes
+        wallet._node = node
+        wallet._private_key = node.hex()
+        wallet._memo = self._root_memo()
+        wallet._frozen = True
+        return wallet
+
     def clean_derivation(self) -> "Wallet":
         """
         Clean derivation indexes/path.
@@ -299,6 +429,8 @@ class Wallet:
         None
         """
 
+        self._check_mutable()
+
         self._indexes = list()
         self.derivation()
         return self
@@ -441,7 +573,8 @@ class Wallet:
         "16476b7fd68ca2acd92cfc38fa353e75d6103f828276f44d587e660a6bd7a5c5ef4490504bd2b6f997113671892458830de09518e6bd5958d5d5dd97624cfa4b"
         """
 
-        return get_xpublic_key(xprivate_key=self.xprivate_key()) if self._xprivate_key else None
+        return self._memoized("xpublic_key", lambda: get_xpublic_key(
+            xprivate_key=self.xprivate_key()) if self._xprivate_key else None)
 
     def expand_xprivate_key(self) -> Optional[str]:
         """
@@ -456,7 +589,8 @@ class Wallet:
         "205b15f70e253399da90b127b074ea02904594be9d54678207872ec1ba31ee5102416c643cfb46ab1ae5a524c8b4aaa002eb771d0d9cfc7490c0c3a8177e053e"
         """
 
-        return get_expand_xprivate_key(xprivate_key=self.xprivate_key()) if self._xprivate_key else None
+        return self._memoized("expand_xprivate_key", lambda: get_expand_xprivate_key(
+            xprivate_key=self.xprivate_key()) if self._xprivate_key else None)
 
     def private_key(self) -> str:
         """
@@ -488,8 +622,11 @@ class Wallet:
         "91ff7f525ff40874c4f47f0cab42e46e3bf53adad59adef9558ad1b6448f22e2"
         """
 
-        return get_public_key(xpublic_key=self.xpublic_key(), indexes=self.indexes()) \
-            if self._xprivate_key else get_xpublic_key(xprivate_key=self.private_key())[:64]
+        if self._node is not None:
+            return self._memoized("public_key", lambda: self._node.public_key().hex())
+        return self._memoized("public_key", lambda: get_public_key(
+            xpublic_key=self.xpublic_key(), indexes=self.indexes()
+        ) if self._xprivate_key else get_xpublic_key(xprivate_key=self.private_key())[:64])
 
     def indexes(self) -> Optional[list]:
         """
@@ -544,8 +681,10 @@ class Wallet:
         "e07af52746e7cccd0a7d1fba6651a6f474bada481f34b1c5bab5e2d71e36ee515803ee0a6682fb19e279d8f4f7acebee8abd0fc74771c71565f9a9643fd77141"
         """
 
-        return get_child_xprivate_key(xprivate_key=self.xprivate_key(),
-                                      indexes=self.indexes()) if self._xprivate_key else None
+        if self._node is not None:
+            return self._node.hex()
+        return self._memoized("child_xprivate_key", lambda: get_child_xprivate_key(
+            xprivate_key=self.xprivate_key(), indexes=self.indexes()) if self._xprivate_key else None)
 
     def child_xpublic_key(self) -> Optional[str]:
         """
@@ -561,8 +700,10 @@ class Wallet:
         "91ff7f525ff40874c4f47f0cab42e46e3bf53adad59adef9558ad1b6448f22e25803ee0a6682fb19e279d8f4f7acebee8abd0fc74771c71565f9a9643fd77141"
         """
 
-        return get_child_xpublic_key(xpublic_key=self.xpublic_key(),
-                                     indexes=self.indexes()) if self._xprivate_key else None
+        if self._node is not None:
+            return self._memoized("child_xpublic_key", lambda: self._node.xpublic_key().hex())
+        return self._memoized("child_xpublic_key", lambda: get_child_xpublic_key(
+            xpublic_key=self.xpublic_key(), indexes=self.indexes()) if self._xprivate_key else None)
 
     def program(self) -> str:
         """
@@ -578,7 +719,7 @@ class Wallet:
         "00142cda4f99ea8112e6fa61cdd26157ed6dc408332a"
         """
 
-        return get_program(public_key=self.public_key())
+        return self._memoized("program", lambda: get_program(public_key=self.public_key()))
 
     def address(self, network: Optional[str] = None, vapor: bool = config["vapor"]) -> str:
         """
@@ -603,7 +744,8 @@ class Wallet:
         if network is None:
             network = self.network
 
-        return get_address(program=self.program(), network=network, vapor=vapor)
+        return self._memoized(("address", network, vapor), lambda: get_address(
+            program=self.program(), network=network, vapor=vapor))
 
     def balance(self, asset: str = config["asset"], vapor: bool = config["vapor"]) -> int:
         """
@@ -667,7 +809,7 @@ class Wallet:
         "f6624fea84fadccbc1bc72dc384f662468e271c4e32d846bc0a1524470549992c8ffcc3ca43891a30de4235392b0868c506ed254f0f77cc1f2b9c1a2385ddb05"
         """
 
-        return sign(private_key=self.private_key(), message=message)
+        return self._memoized("signer", lambda: Signer(private_key=self.private_key())).sign(message=message)
 
     def verify(self, message: str, signature: str) -> bool:
         """
@@ -691,12 +833,14 @@ class Wallet:
 
         return verify(public_key=self.public_key(), message=message, signature=signature)
 
-    def dumps(self, guid: bool = False) -> dict:
+    def dumps(self, guid: bool = False, fields: Optional[List[str]] = None) -> dict:
         """
         Get Bytom all wallet information's
 
         :param guid: Get GUID, default to False.
         :type guid: bool.
+        :param fields: Wallet information's to get, default to None (all of them).
+        :type fields: list.
         :return: dict -- Bytom all wallet information's.
 
         >>> from pybytom.wallet import Wallet
@@ -705,34 +849,102 @@ class Wallet:
         >>> wallet.from_indexes(["2c000000", "99000000", "01000000", "00000000", "01000000"])
         >>> wallet.dumps()
         {'strength': 128, 'entropy': None, 'mnemonic': 'indicate warm sock mistake code spot acid ribbon sing over taxi toast', 'language': 'english', 'passphrase': None, 'seed': 'baff3e1fe60e1f2a2d840d304acc98d1818140c79354a353b400fb019bfb256bc392d7aa9047adff1f14bce0342e14605c6743a6c08e02150588375eb2eb7d49', 'xprivate_key': '205b15f70e253399da90b127b074ea02904594be9d54678207872ec1ba31ee51ef4490504bd2b6f997113671892458830de09518e6bd5958d5d5dd97624cfa4b', 'xpublic_key': '16476b7fd68ca2acd92cfc38fa353e75d6103f828276f44d587e660a6bd7a5c5ef4490504bd2b6f997113671892458830de09518e6bd5958d5d5dd97624cfa4b', 'expand_xprivate_key': '205b15f70e253399da90b127b074ea02904594be9d54678207872ec1ba31ee5102416c643cfb46ab1ae5a524c8b4aaa002eb771d0d9cfc7490c0c3a8177e053e', 'guid': None, 'indexes': ['2c000000', '99000000', '01000000', '00000000', '01000000'], 'path': 'm/44/153/1/0/1', 'child_xprivate_key': 'e07af52746e7cccd0a7d1fba6651a6f474bada481f34b1c5bab5e2d71e36ee515803ee0a6682fb19e279d8f4f7acebee8abd0fc74771c71565f9a9643fd77141', 'child_xpublic_key': '91ff7f525ff40874c4f47f0cab42e46e3bf53adad59adef9558ad1b6448f22e25803ee0a6682fb19e279d8f4f7acebee8abd0fc74771c71565f9a9643fd77141', 'private_key': 'e07af52746e7cccd0a7d1fba6651a6f474bada481f34b1c5bab5e2d71e36ee515803ee0a6682fb19e279d8f4f7acebee8abd0fc74771c71565f9a9643fd77141', 'public_key': '91ff7f525ff40874c4f47f0cab42e46e3bf53adad59adef9558ad1b6448f22e2', 'program': '00142cda4f99ea8112e6fa61cdd26157ed6dc408332a', 'address': {'mainnet': 'bm1q9ndylx02syfwd7npehfxz4lddhzqsve2fu6vc7', 'solonet': 'sm1q9ndylx02syfwd7npehfxz4lddhzqsve2gdsdcs', 'testnet': 'tm1q9ndylx02syfwd7npehfxz4lddhzqsve2d2mgc0'}}
+        >>> wallet.dumps(fields=["address", "path"])
+        {'address': {'mainnet': 'bm1q9ndylx02syfwd7npehfxz4lddhzqsve2fu6vc7', 'solonet': 'sm1q9ndylx02syfwd7npehfxz4lddhzqsve2gdsdcs', 'testnet': 'tm1q9ndylx02syfwd7npehfxz4lddhzqsve2d2mgc0'}, 'path': 'm/44/153/1/0/1'}
         """
 
-        return dict(
-            strength=self.strength(),
-            entropy=self.entropy(),
-            mnemonic=self.mnemonic(),
-            language=self.language(),
-            passphrase=self.passphrase(),
-            seed=self.seed(),
-            xprivate_key=self.xprivate_key(),
-            xpublic_key=self.xpublic_key(),
-            expand_xprivate_key=self.expand_xprivate_key(),
-            guid=self.guid() if guid else None,
-            indexes=self.indexes(),
-            path=self.path(),
-            child_xprivate_key=self.child_xprivate_key(),
-            child_xpublic_key=self.child_xpublic_key(),
-            private_key=self.private_key(),
-            public_key=self.public_key(),
-            program=self.program(),
-            address=dict(
-                mainnet=self.address(network="mainnet", vapor=False),
-                solonet=self.address(network="solonet", vapor=False),
-                testnet=self.address(network="testnet", vapor=False)
-            ),
-            vapor_address=dict(
-                mainnet=self.address(network="mainnet", vapor=True),
-                solonet=self.address(network="solonet", vapor=True),
-                testnet=self.address(network="testnet", vapor=True)
-            )
-        )
+        view = self.view(guid=guid)
+        if fields is None:
+            return dict(view)
+        for field in fields:
+            if field not in view:
+                raise ValueError(f"Invalid '{field}' field, choose only the following options "
+                                 f"{', '.join(DUMPS_FIELDS)} fields.")
+        return {field: view[field] for field in fields}
+
+    def view(self, guid: bool = False) -> "WalletView":
+        """
+        Get Bytom wallet information's as a lazy mapping, computing a field only when it's read.
+
+        :param guid: Get GUID, default to False.
+        :type guid: bool.
+        :return: WalletView -- Bytom wallet information's view.
+
+        >>> from pybytom.wallet import Wallet
+        >>> wallet = Wallet()
+        >>> wallet.from_mnemonic("indicate warm sock mistake code spot acid ribbon sing over taxi toast")
+        >>> wallet.from_indexes(["2c000000", "99000000", "01000000", "00000000", "01000000"])
+        >>> wallet.view()["program"]
+        "00142cda4f99ea8112e6fa61cdd26157ed6dc408332a"
+        """
+
+        return WalletView(wallet=self, guid=guid)
+
+
+def _addresses(wallet: Wallet, vapor: bool) -> dict:
+    return dict(
+        mainnet=wallet.address(network="mainnet", vapor=vapor),
+        solonet=wallet.address(network="solonet", vapor=vapor),
+        testnet=wallet.address(network="testnet", vapor=vapor)
+    )
+
+
+# Wallet dumps fields, in dumps order, with the way to get them.
+_DUMPS_FIELDS: dict = dict(
+    strength=lambda wallet, guid: wallet.strength(),
+    entropy=lambda wallet, guid: wallet.entropy(),
+    mnemonic=lambda wallet, guid: wallet.mnemonic(),
+    language=lambda wallet, guid: wallet.language(),
+    passphrase=lambda wallet, guid: wallet.passphrase(),
+    seed=lambda wallet, guid: wallet.seed(),
+    xprivate_key=lambda wallet, guid: wallet.xprivate_key(),
+    xpublic_key=lambda wallet, guid: wallet.xpublic_key(),
+    expand_xprivate_key=lambda wallet, guid: wallet.expand_xprivate_key(),
+    guid=lambda wallet, guid: wallet.guid() if guid else None,
+    indexes=lambda wallet, guid: wallet.indexes(),
+    path=lambda wallet, guid: wallet.path(),
+    child_xprivate_key=lambda wallet, guid: wallet.child_xprivate_key(),
+    child_xpublic_key=lambda wallet, guid: wallet.child_xpublic_key(),
+    private_key=lambda wallet, guid: wallet.private_key(),
+    public_key=lambda wallet, guid: wallet.public_key(),
+    program=lambda wallet, guid: wallet.program(),
+    address=lambda wallet, guid: _addresses(wallet, vapor=False),
+    vapor_address=lambda wallet, guid: _addresses(wallet, vapor=True)
+)
+DUMPS_FIELDS: Tuple[str, ...] = tuple(_DUMPS_FIELDS)
+
+
+class WalletView(Mapping):
+    """
+    Bytom wallet information's view, a read-only mapping of the dumps fields.
+
+    Fields are computed from the wallet when they're read, through its memoized state, so
+    the view follows later derivation changes of the wallet.
+
+    :param wallet: Bytom wallet.
+    :type wallet: Wallet
+    :param guid: Get GUID, default to False.
+    :type guid: bool
+    :returns: WalletView -- Bytom wallet information's view instance.
+    """
+
+    __slots__ = ("_wallet", "_guid")
+
+    def __init__(self, wallet: Wallet, guid: bool = False):
+        self._wallet: Wallet = wallet
+        self._guid: bool = guid
+
+    def __getitem__(self, field: str):
+        return _DUMPS_FIELDS[field](self._wallet, self._guid)
+
+    def __contains__(self, field) -> bool:
+        return field in _DUMPS_FIELDS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(DUMPS_FIELDS)
+
+    def __len__(self) -> int:
+        return len(DUMPS_FIELDS)
+
+    def __repr__(self) -> str:
+        return f"WalletView(fields={list(DUMPS_FIELDS)})"
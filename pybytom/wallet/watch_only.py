@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Iterable, Iterator, Optional, Union
+)
+
+from ..config import config
+from ..exceptions import NetworkError
+from ..rpc import (
+    get_balance, get_utxos
+)
+from ..utils import is_network
+from .keys import ExtendedPublicKey
+from .tools import (
+    get_address, get_program, get_bytes, path_to_indexes
+)
+
+
+class WatchOnlyWallet:
+    """
+    Bytom watch-only wallet from xpublic key.
+
+    Only the 64 bytes xpublic key and the 20 bytes public key hash of the program are kept,
+    hex strings and addresses are rendered when asked.
+
+    :param xpublic_key: Bytom xpublic key.
+    :type xpublic_key: str
+    :param path: Bytom derivation path from the xpublic key, default to None.
+    :type path: str
+    :param network: Bytom network, defaults to mainnet.
+    :type network: str
+    :returns: WatchOnlyWallet -- Bytom watch-only wallet instance.
+
+    >>> from pybytom.wallet import WatchOnlyWallet
+    >>> watch_only_wallet = WatchOnlyWallet("16476b7fd68ca2acd92cfc38fa353e75d6103f828276f44d587e660a6bd7a5c5ef4490504bd2b6f997113671892458830de09518e6bd5958d5d5dd97624cfa4b", "m/44/153/1/0/1", "mainnet")
+    >>> watch_only_wallet.address()
+    "bm1q9ndylx02syfwd7npehfxz4lddhzqsve2fu6vc7"
+    """
+
+    __slots__ = ("network", "_xpublic_key", "_hash")
+
+    def __init__(self, xpublic_key: Union[str, bytes], path: Optional[str] = None,
+                 network: str = config["network"]):
+        if not is_network(network=network):
+            raise NetworkError(f"Invalid '{network}' network",
+                               "choose only 'mainnet', 'solonet' or 'testnet' networks.")
+        self.network: str = network
+
+        xpublic = ExtendedPublicKey(get_bytes(xpublic_key))
+        if path is not None:
+            xpublic = xpublic.derive([get_bytes(index) for index in path_to_indexes(path=path)])
+        self._xpublic_key: bytes = bytes(xpublic)
+        self._hash: bytes = get_bytes(get_program(public_key=xpublic.public_key().hex())[4:])
+
+    @classmethod
+    def _from_columns(cls, xpublic_key: bytes, public_key_hash: bytes, network: str) -> "WatchOnlyWallet":
+        watch_only_wallet = cls.__new__(cls)
+        watch_only_wallet.network = network
+        watch_only_wallet._xpublic_key = xpublic_key
+        watch_only_wallet._hash = public_key_hash
+        return watch_only_wallet
+
+    def child(self, index: int) -> "WatchOnlyWallet":
+        """
+        Get the watch-only wallet of a non-hardened child index.
+
+        :param index: Bytom derivation index.
+        :type index: int
+        :returns: WatchOnlyWallet -- Bytom watch-only wallet instance.
+        """
+
+        xpublic = ExtendedPublicKey(self._xpublic_key).child(int(index).to_bytes(4, byteorder="little"))
+        return self._from_columns(
+            bytes(xpublic), get_bytes(get_program(public_key=xpublic.public_key().hex())[4:]), self.network
+        )
+
+    def xpublic_key(self) -> str:
+        return self._xpublic_key.hex()
+
+    def public_key(self) -> str:
+        return self._xpublic_key[:32].hex()
+
+    def program(self) -> str:
+        return "0014" + self._hash.hex()
+
+    def address(self, network: Optional[str] = None, vapor: bool = config["vapor"]) -> str:
+        return get_address(
+            program=self.program(), network=self.network if network is None else network, vapor=vapor
+        )
+
+    def balance(self, asset: str = config["asset"], vapor: bool = config["vapor"]) -> int:
+        return get_balance(
+            address=self.address(vapor=vapor), asset=asset, network=self.network, vapor=vapor
+        )
+
+    def utxos(self, asset: str = config["asset"], limit: int = 15, vapor: bool = config["vapor"]) -> list:
+        return get_utxos(program=self.program(), network=self.network, asset=asset, limit=limit, vapor=vapor)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, WatchOnlyWallet) and \
+            (self.network, self._xpublic_key) == (other.network, other._xpublic_key)
+
+    def __hash__(self) -> int:
+        return hash(self._xpublic_key)
+
+    def __repr__(self) -> str:
+        return f"WatchOnlyWallet({self.xpublic_key()!r}, network={self.network!r})"
+
+
+class WatchOnlyWallets:
+    """
+    Bytom watch-only wallets of one network stored in columns.
+
+    Xpublic keys and public key hashes are packed in two bytearrays, 84 bytes per wallet,
+    and WatchOnlyWallet nodes are only built when read.
+
+    :param network: Bytom network, defaults to mainnet.
+    :type network: str
+    :param xpublic_keys: Bytom xpublic keys to add, default to None.
+    :type xpublic_keys: list
+    :returns: WatchOnlyWallets -- Bytom watch-only wallets instance.
+
+    >>> from pybytom.wallet import WatchOnlyWallets
+    >>> watch_only_wallets = WatchOnlyWallets("mainnet", ["91ff7f525ff40874c4f47f0cab42e46e3bf53adad59adef9558ad1b6448f22e25803ee0a6682fb19e279d8f4f7acebee8abd0fc74771c71565f9a9643fd77141"])
+    >>> watch_only_wallets.index("00142cda4f99ea8112e6fa61cdd26157ed6dc408332a")
+    0
+    >>> watch_only_wallets[0].address()
+    "bm1q9ndylx02syfwd7npehfxz4lddhzqsve2fu6vc7"
+    """
+
+    __slots__ = ("network", "_xpublic_keys", "_hashes")
+
+    def __init__(self, network: str = config["network"], xpublic_keys: Optional[Iterable[str]] = None):
+        if not is_network(network=network):
+            raise NetworkError(f"Invalid '{network}' network",
+                               "choose only 'mainnet', 'solonet' or 'testnet' networks.")
+        self.network: str = network
+        self._xpublic_keys: bytearray = bytearray()
+        self._hashes: bytearray = bytearray()
+        if xpublic_keys is not None:
+            self.extend(xpublic_keys)
+
+    def append(self, xpublic_key: Union[str, bytes, WatchOnlyWallet]) -> None:
+        """
+        Add a watch-only wallet, from its xpublic key or a WatchOnlyWallet node of the same
+        network, raises ValueError otherwise.
+        """
+
+        if isinstance(xpublic_key, WatchOnlyWallet):
+            if xpublic_key.network != self.network:
+                raise ValueError(f"Invalid '{xpublic_key.network}' watch-only wallet network, "
+                                 f"these watch-only wallets are '{self.network}'.")
+            self._xpublic_keys += xpublic_key._xpublic_key
+            self._hashes += xpublic_key._hash
+            return
+        xpublic_bytes = get_bytes(xpublic_key)
+        if len(xpublic_bytes) != 64:
+            raise ValueError("Invalid xpublic key, it must be 64 bytes.")
+        self._xpublic_keys += xpublic_bytes
+        self._hashes += get_bytes(get_program(public_key=xpublic_bytes[:32].hex())[4:])
+
+    def extend(self, xpublic_keys: Iterable[Union[str, bytes, WatchOnlyWallet]]) -> None:
+        for xpublic_key in xpublic_keys:
+            self.append(xpublic_key)
+
+    def index(self, program: str) -> int:
+        """
+        Get the position of the watch-only wallet of a control program.
+
+        :param program: Bytom control program.
+        :type program: str
+        :return: int -- Position, raises ValueError if it's not here.
+        """
+
+        # only pay to public key hash programs, a shorter hash could match across entries
+        if len(program) != 44 or program[:4] != "0014":
+            raise ValueError(f"Invalid program '{program}', it must be 0014 and a 20 bytes public key hash.")
+        public_key_hash = get_bytes(program[4:])
+        position = self._hashes.find(public_key_hash)
+        while position != -1:
+            if position % 20 == 0:
+                return position // 20
+            position = self._hashes.find(public_key_hash, position + 1)
+        raise ValueError(f"Program '{program}' is not in watch-only wallets.")
+
+    def __contains__(self, program: str) -> bool:
+        try:
+            self.index(program)
+        except ValueError:
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return len(self._hashes) // 20
+
+    def __getitem__(self, position: int) -> WatchOnlyWallet:
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("watch-only wallets index out of range")
+        return WatchOnlyWallet._from_columns(
+            bytes(self._xpublic_keys[position * 64:position * 64 + 64]),
+            bytes(self._hashes[position * 20:position * 20 + 20]), self.network
+        )
+
+    def __iter__(self) -> Iterator[WatchOnlyWallet]:
+        for position in range(len(self)):
+            yield self[position]
@@ -30,6 +30,9 @@ setup(
         "tests": [
             "pytest>=6.1.2,<7",
             "pytest-cov>=2.10.1,<3"
+        ],
+        "nacl": [
+            "PyNaCl>=1.4.0,<2"
         ]
     },
     classifiers=[
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+import hashlib
+import json
+import os
+import random
+
+import pytest
+
+from pybytom.libs import backends
+from pybytom.libs.backends import (
+    PythonBackend, available_backends, set_backend, get_backend
+)
+from pybytom.signature import sign, verify
+from pybytom.wallet.tools import (
+    get_xpublic_key, get_child_xprivate_key, get_child_xpublic_key, get_child_xpublic_keys
+)
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "..", "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+RANDOM = random.Random(153)
+SCALARS = [bytes(32), (1).to_bytes(32, "little"), b"\xff" * 32] + [
+    RANDOM.getrandbits(256).to_bytes(32, "little") for i in range(16)
+]
+
+
+@pytest.fixture(params=available_backends())
+def backend(request):
+    selected = backends._backend
+    yield set_backend(request.param)
+    backends._backend = selected
+
+
+def test_values(backend):
+
+    assert get_backend() is backend
+    assert get_xpublic_key(xprivate_key=_["wallet"]["xprivate_key"]) == _["wallet"]["xpublic_key"]
+    assert get_child_xprivate_key(
+        xprivate_key=_["wallet"]["xprivate_key"], path=_["wallet"]["path"]
+    ) == _["wallet"]["child_xprivate_key"]
+    assert get_child_xpublic_key(
+        xpublic_key=_["wallet"]["xpublic_key"], path=_["wallet"]["path"]
+    ) == _["wallet"]["child_xpublic_key"]
+    assert get_child_xpublic_keys(
+        xpublic_key=_["wallet"]["xpublic_key"], children=["01000000"], indexes=_["wallet"]["indexes"][:-1]
+    ) == [_["wallet"]["child_xpublic_key"]]
+
+    message = hashlib.sha256(backend.name.encode()).hexdigest()
+    signature = sign(private_key=_["wallet"]["private_key"], message=message)
+    assert verify(public_key=_["wallet"]["public_key"], message=message, signature=signature)
+
+
+def test_random(backend):
+
+    python = PythonBackend()
+    for a, b, c in zip(SCALARS, SCALARS[1:] + SCALARS[:1], SCALARS[2:] + SCALARS[:2]):
+        assert backend.scalar_reduce(a + b) == python.scalar_reduce(a + b)
+        assert backend.scalar_muladd(a, b, c) == python.scalar_muladd(a, b, c)
+
+        A, B = backend.scalarmult_base(a), backend.scalarmult_base(b)
+        encoded = backend.encode_point(backend.point_add(A, B))
+        assert encoded == python.encode_point(python.point_add(
+            python.scalarmult_base(a), python.scalarmult_base(b)
+        ))
+        assert backend.encode_point(backend.decode_point(encoded)) == encoded
+        assert backend.encode_points([A, B]) == [backend.encode_point(A), backend.encode_point(B)]
+
+    for i in range(16):
+        encoded = RANDOM.getrandbits(256).to_bytes(32, "little")
+        try:
+            expected = python.encode_point(python.decode_point(encoded))
+        except ValueError:
+            with pytest.raises(ValueError):
+                backend.decode_point(encoded)
+        else:
+            assert backend.encode_point(backend.decode_point(encoded)) == expected
+
+
+def test_set_backend():
+
+    with pytest.raises(ValueError, match="Invalid 'openssl' ed25519 backend"):
+        set_backend("openssl")
+
+
+def test_old_nacl(monkeypatch):
+
+    # PyNaCl before 1.4 has no ed25519 core functions, the python backend is used instead.
+    bindings = pytest.importorskip("nacl.bindings")
+    monkeypatch.delattr(bindings, "has_crypto_core_ed25519", raising=False)
+    monkeypatch.setattr(backends, "_backend", None)
+    monkeypatch.delenv("PYBYTOM_ED25519_BACKEND", raising=False)
+
+    assert available_backends() == ["python"]
+    assert get_backend().name == "python"
+    signature = sign(private_key=_["wallet"]["private_key"], message=_["wallet"]["xpublic_key"][:64])
+    assert verify(public_key=_["wallet"]["public_key"], message=_["wallet"]["xpublic_key"][:64], signature=signature)
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import pytest
+import random
+import subprocess
+import sys
+
+from pybytom.libs import ed25519
+from pybytom.libs.ed25519 import (
+    B, Bx, By, d, I, q, l, ident, inv, xrecover, edwards_add, edwards_double,
+    scalarmult, scalarmult_B, scalarmult_comb, make_comb_table, radix16, wnaf, straus, pippenger, multiscalarmult,
+    encodepoint, encodepoints, decodepoint, encodeint, decodeint,
+    decodepoint_cached, decodepoint_cache_info, decodepoint_cache_clear, set_decodepoint_cache_size,
+    scalar_reduce, scalar_muladd, sc_reduce32, sc_muladd
+)
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "..", "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+RANDOM = random.Random(153)
+SCALARS = [0, 1, 2, 8, 15, 16, 17, l - 1, l, l + 1, 2 ** 252, 2 ** 255 - 1] + [
+    RANDOM.getrandbits(256) for i in range(16)
+]
+
+
+def double_and_add(P, e):
+    Q = ident
+    for i in reversed(range(e.bit_length())):
+        Q = edwards_double(Q)
+        if (e >> i) & 1:
+            Q = edwards_add(Q, P)
+    return Q
+
+
+def test_radix16():
+
+    for scalar in SCALARS:
+        scalar %= l
+        digits = radix16(scalar)
+        assert len(digits) == 64
+        assert all(-8 <= digit < 8 for digit in digits[:63])
+        assert 0 <= digits[63] <= 8
+        assert sum(digit * 16 ** i for i, digit in enumerate(digits)) == scalar
+
+
+def test_scalarmult_B():
+
+    for scalar in SCALARS:
+        assert encodepoint(scalarmult_B(scalar)) == encodepoint(scalarmult(B, scalar % l))
+    assert encodepoint(scalarmult_B(int.from_bytes(bytes.fromhex(
+        _["wallet"]["xprivate_key"]
+    )[:32], "little"))).hex() == _["wallet"]["xpublic_key"][:64]
+
+
+def test_scalarmult_comb():
+
+    P = scalarmult_B(int(_["wallet"]["seed"], 16))
+    table = make_comb_table(P)
+    for scalar in SCALARS:
+        if scalar < 2 ** 255:
+            assert encodepoint(scalarmult_comb(table, scalar)) == encodepoint(scalarmult(P, scalar))
+    for scalar in [-1, 2 ** 255, 2 ** 255 + 2 ** 254]:
+        with pytest.raises(ValueError, match="comb table scalar out of range"):
+            scalarmult_comb(table, scalar)
+
+
+def test_wnaf():
+
+    for scalar in SCALARS:
+        digits = wnaf(scalar)
+        assert sum(digit * 2 ** i for i, digit in enumerate(digits)) == scalar
+        for i, digit in enumerate(digits):
+            if digit:
+                assert digit % 2 == 1 and -16 < digit < 16
+                assert not any(digits[i + 1:i + 5])
+
+
+def test_scalarmult(monkeypatch):
+
+    P = scalarmult_B(int(_["wallet"]["seed"], 16))
+    for scalar in SCALARS:
+        assert encodepoint(scalarmult(P, scalar)) == encodepoint(double_and_add(P, scalar))
+    for scalar in [1, 2, 17, l - 1]:
+        assert encodepoint(edwards_add(scalarmult(P, -scalar), scalarmult(P, scalar))) == encodepoint(ident)
+
+    additions = []
+    monkeypatch.setattr(ed25519, "edwards_add", lambda P, Q: additions.append(1) or edwards_add(P, Q))
+    for scalar in SCALARS[-16:]:
+        del additions[:]
+        scalarmult(P, scalar)
+        assert 2 * len(additions) <= bin(scalar).count("1")
+
+
+def test_codec():
+
+    for scalar in SCALARS:
+        assert decodeint(encodeint(scalar)) == scalar % 2 ** 256
+        encoded = encodepoint(scalarmult_B(scalar))
+        assert encodepoint(decodepoint(encoded)) == encoded
+
+    digest = bytes.fromhex(_["wallet"]["seed"])
+    assert decodeint(scalar_reduce(digest)) == int.from_bytes(digest, "little") % l
+    assert sc_reduce32(digest.hex().encode()) == scalar_reduce(digest).hex().encode()
+
+    a, b, c = encodeint(SCALARS[-1]), encodeint(SCALARS[-2]), encodeint(SCALARS[-3])
+    assert decodeint(scalar_muladd(a, b, c)) == (SCALARS[-1] * SCALARS[-2] + SCALARS[-3]) % l
+    assert sc_muladd(a.hex().encode(), b.hex().encode(), c.hex().encode()) == scalar_muladd(a, b, c).hex().encode()
+
+
+def test_encodepoints():
+
+    points = [scalarmult_B(scalar) for scalar in SCALARS]
+    assert encodepoints(points) == [encodepoint(P) for P in points]
+    assert encodepoints([]) == []
+
+
+def test_multiscalarmult():
+
+    points = [scalarmult_B(scalar) for scalar in SCALARS]
+    scalars = [scalar % l for scalar in reversed(SCALARS)]
+    expected = ident
+    for scalar, P in zip(scalars, points):
+        expected = edwards_add(expected, scalarmult(P, scalar))
+    assert encodepoint(straus(scalars, points)) == encodepoint(expected)
+    assert encodepoint(pippenger(scalars, points)) == encodepoint(expected)
+    assert encodepoint(multiscalarmult(scalars, points)) == encodepoint(expected)
+    assert encodepoint(multiscalarmult([], [])) == encodepoint(ident)
+
+
+def test_import_time():
+
+    assert d == -121665 * inv(121666) % q
+    assert I == pow(2, (q - 1) // 4, q)
+    assert By == 4 * inv(5) % q and Bx == xrecover(By)
+
+    # Import in a fresh interpreter, the base point tables must not be built yet.
+    subprocess.run(
+        [sys.executable, "-c", "import pybytom.libs.ed25519 as ed25519; assert not ed25519.Btable"],
+        check=True
+    )
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="-X importtime needs Python 3.7 or newer")
+def test_import_time_budget():
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import pybytom.libs.ed25519"],
+        stderr=subprocess.PIPE, universal_newlines=True, check=True
+    )
+    self_times = [
+        int(line.split(":")[1].split("|")[0]) for line in process.stderr.splitlines()
+        if line.endswith(" pybytom.libs.ed25519")
+    ]
+    # Import time budget of the module itself in microseconds.
+    assert self_times and max(self_times) < 50_000
+
+
+def test_decodepoint_cached():
+
+    encoded = [encodepoint(scalarmult_B(scalar)) for scalar in SCALARS[-4:]]
+    set_decodepoint_cache_size(2)
+    try:
+        for point in encoded + encoded[-1:] + encoded[:1]:
+            assert decodepoint_cached(point) == decodepoint(point)
+        info = decodepoint_cache_info()
+        assert (info.hits, info.misses, info.maxsize, info.currsize) == (1, 5, 2, 2)
+        decodepoint_cache_clear()
+        assert decodepoint_cache_info().currsize == 0
+    finally:
+        set_decodepoint_cache_size(1024)
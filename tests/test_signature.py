@@ -4,7 +4,14 @@ import hashlib
 import json
 import os
 
-from pybytom.signature import sign, verify
+from pybytom.signature import (
+    sign, verify, verify_batch, sign_many_parallel, Signer, Verifier,
+    set_verify_cache_size, verify_cache_info, verify_cache_clear, _signers
+)
+from pybytom.libs.ed25519 import (
+    l, PIPPENGER_THRESHOLD, decodeint, decodepoint, encodeint, encodepoint, scalarmultbase, edwards_add
+)
+from pybytom.wallet.tools import get_xpublic_key
 
 # Test Values
 base_path = os.path.dirname(__file__)
@@ -21,3 +28,121 @@ def test_signature():
     signature = sign(private_key=_["wallet"]["private_key"], message=MESSAGE)
     assert isinstance(signature, str)
     assert verify(public_key=_["wallet"]["public_key"], message=MESSAGE, signature=signature)
+
+
+def test_verify_batch():
+
+    private_keys = [
+        hashlib.sha512(str(index).encode()).hexdigest() for index in range(8)
+    ]
+    entries = [
+        (get_xpublic_key(private_key)[:64], MESSAGE, sign(private_key=private_key, message=MESSAGE))
+        for private_key in private_keys
+    ]
+    assert verify_batch(entries) == [True] * 8
+    assert verify_batch([]) == []
+
+    entries[2] = (entries[2][0], hashlib.sha256(b"bad").hexdigest(), entries[2][2])
+    entries[5] = (entries[5][0], MESSAGE, entries[6][2])
+    entries[7] = (entries[7][0], MESSAGE, "00" * 64)
+    assert verify_batch(entries) == [True, True, False, True, True, False, True, False]
+
+    # Batches of PIPPENGER_THRESHOLD points and more go through Pippenger.
+    entries = [
+        (get_xpublic_key(private_key)[:64], message, sign(private_key=private_key, message=message))
+        for private_key, message in [
+            (hashlib.sha512(str(index).encode()).hexdigest(), hashlib.sha256(str(index).encode()).hexdigest())
+            for index in range(PIPPENGER_THRESHOLD // 2 + 1)
+        ]
+    ]
+    entries[0], entries[-1] = entries[0][:2] + (entries[1][2],), (entries[-1][0], MESSAGE, entries[-1][2])
+    assert verify_batch(entries) == [False] + [True] * (len(entries) - 2) + [False]
+
+
+def _torsioned_entry(message: str) -> tuple:
+    # signature of a public key shifted by an order 8 point, valid for the cofactored equation only
+    a, r = decodeint(hashlib.sha256(b"a").digest()) % l, decodeint(hashlib.sha256(message.encode()).digest()) % l
+    torsion = decodepoint(bytes.fromhex("26e8958fc2b227b045c3f489f2ef98f0d5dfac05d3c63339b13802886d53fc05"))
+    public_key = encodepoint(edwards_add(scalarmultbase(a), torsion))
+    R = encodepoint(scalarmultbase(r))
+    h = int.from_bytes(hashlib.sha512(R + public_key + bytes.fromhex(message)).digest(), "little") % l
+    return public_key.hex(), message, (R + encodeint((r + h * a) % l)).hex(), h % 8 == 0
+
+
+def test_verify_batch_torsion():
+
+    private_key = hashlib.sha512(b"0").hexdigest()
+    good = (get_xpublic_key(private_key)[:64], MESSAGE, sign(private_key=private_key, message=MESSAGE))
+    bad = (good[0], hashlib.sha256(b"bad").hexdigest(), good[2])
+
+    torsioned = [_torsioned_entry(hashlib.sha256(str(index).encode()).hexdigest()) for index in range(32)]
+    rejected = next(entry[:3] for entry in torsioned if not entry[3])
+    accepted = next(entry[:3] for entry in torsioned if entry[3])
+    assert not verify(*rejected) and verify(*accepted)
+
+    # The cofactored batch equation accepts both, whatever batch they're in.
+    for torsioned_entry in [rejected, accepted]:
+        for batch in [[torsioned_entry], [torsioned_entry, good], [torsioned_entry, good, bad]]:
+            assert verify_batch(batch) == [True, True, False][:len(batch)]
+
+
+def test_verifier():
+
+    verifier = Verifier(public_key=_["wallet"]["public_key"])
+    assert verifier.public_key() == _["wallet"]["public_key"]
+
+    signature = sign(private_key=_["wallet"]["private_key"], message=MESSAGE)
+    assert verifier.verify(message=MESSAGE, signature=signature)
+    assert not verifier.verify(message=hashlib.sha256(b"bad").hexdigest(), signature=signature)
+    assert not verifier.verify(message=MESSAGE, signature=signature[:64] + "ff" * 32)
+    assert not verifier.verify(message=MESSAGE, signature=signature[:-2])
+
+
+def test_signer():
+
+    signer = Signer(private_key=_["wallet"]["private_key"])
+    assert signer.public_key() == _["wallet"]["public_key"]
+
+    messages = [hashlib.sha256(str(index).encode()).hexdigest() for index in range(4)]
+    assert signer.sign(message=MESSAGE) == sign(private_key=_["wallet"]["private_key"], message=MESSAGE)
+    assert signer.sign_many(messages=messages) == [
+        sign(private_key=_["wallet"]["private_key"], message=message) for message in messages
+    ]
+
+
+def test_sign_many_parallel():
+
+    jobs = [
+        (private_key, hashlib.sha256(str(index).encode()).hexdigest())
+        for index in range(6) for private_key in [_["wallet"]["private_key"], _["wallet"]["xprivate_key"]]
+    ]
+    signatures = [sign(private_key=private_key, message=message) for private_key, message in jobs]
+    assert sign_many_parallel(jobs, workers=2, chunk_size=4) == signatures
+    assert sign_many_parallel(jobs, workers=1) == signatures
+    # inline signing keeps no private keys in this process
+    assert len(_signers) == 0
+    assert sign_many_parallel([], workers=2) == []
+
+
+def test_verify_cache():
+
+    signatures = [
+        sign(private_key=_["wallet"]["private_key"], message=hashlib.sha256(str(index).encode()).hexdigest())
+        for index in range(3)
+    ]
+    set_verify_cache_size(2)
+    try:
+        for index in [0, 1, 0, 2, 1, 0]:
+            assert verify(
+                public_key=_["wallet"]["public_key"],
+                message=hashlib.sha256(str(index).encode()).hexdigest(), signature=signatures[index]
+            )
+        assert not verify(public_key=_["wallet"]["public_key"], message=MESSAGE, signature=signatures[0])
+        assert not verify(public_key=_["wallet"]["public_key"], message=MESSAGE, signature=signatures[0])
+        assert verify_cache_info() == (1, 7, 2, 2)
+
+        verify_cache_clear()
+        assert verify_cache_info() == (0, 0, 2, 0)
+    finally:
+        set_verify_cache_size(0)
+    assert verify_cache_info().maxsize == 0
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+
+import csv
+import json
+import os
+import pytest
+
+from pybytom.exceptions import NetworkError
+from pybytom.wallet import (
+    Wallet, DEFAULT_PATH
+)
+from pybytom.wallet.bulk import (
+    RECORD, ImportedWallet, generate_addresses, generate_programs, write_addresses, import_wallets
+)
+from pybytom.wallet.cache import derivation_cache
+from pybytom.wallet.tools import (
+    iter_addresses, get_address
+)
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "..", "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+
+def test_generate_addresses():
+
+    expected = list(iter_addresses(xpublic_key=_["wallet"]["xpublic_key"], start=2, stop=12, vapor=True))
+    for workers in [1, 2]:
+        assert list(generate_addresses(
+            xpublic_key=_["wallet"]["xpublic_key"], start=2, stop=12, vapor=True, workers=workers, chunk_size=3
+        )) == expected
+
+    # arguments are checked on call, not on the first address, and stop defaults to unbounded
+    with pytest.raises(NetworkError, match=r"Invalid 'unknown' network"):
+        generate_addresses(xpublic_key=_["wallet"]["xpublic_key"], network="unknown")
+    assert next(generate_addresses(xpublic_key=_["wallet"]["xpublic_key"], start=2**31 - 1)) == next(
+        iter_addresses(xpublic_key=_["wallet"]["xpublic_key"], start=2**31 - 1)
+    )
+
+    assert list(generate_addresses(
+        xpublic_key=_["wallet"]["xpublic_key"], start=1, stop=2, network="testnet"
+    )) == [(1, _["wallet"]["public_key"], _["wallet"]["program"], _["wallet"]["address"]["testnet"])]
+
+
+def test_generate_programs():
+
+    expected = list(iter_addresses(xpublic_key=_["wallet"]["xpublic_key"], account=2, change=1, stop=10))
+    for workers in [1, 2]:
+        assert list(generate_programs(
+            xpublic_key=_["wallet"]["xpublic_key"], account=2, change=1, stop=10, workers=workers, chunk_size=3
+        )) == [(index, program) for index, public_key, program, address in expected]
+
+    with pytest.raises(ValueError, match=r"Invalid chunk size"):
+        generate_programs(xpublic_key=_["wallet"]["xpublic_key"], chunk_size=0)
+
+
+def test_write_addresses(tmp_path):
+
+    expected = list(iter_addresses(xpublic_key=_["wallet"]["xpublic_key"], stop=7))
+
+    csv_path = str(tmp_path / "addresses.csv")
+    assert write_addresses(
+        csv_path, xpublic_key=_["wallet"]["xpublic_key"], stop=7, workers=2, chunk_size=2
+    ) == 7
+    with open(csv_path, newline="") as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == ["index", "public_key", "program", "address"]
+    assert rows[1:] == [[str(index), public_key, program, address] for index, public_key, program, address in expected]
+
+    binary_path = str(tmp_path / "addresses.bin")
+    assert write_addresses(
+        binary_path, xpublic_key=_["wallet"]["xpublic_key"], stop=7, workers=2, chunk_size=2, binary=True
+    ) == 7
+    with open(binary_path, "rb") as file:
+        data = file.read()
+    assert len(data) == 7 * RECORD.size
+    for (index, public_key, program), row in zip(RECORD.iter_unpack(data), expected):
+        assert (index, public_key.hex(), program.hex(), get_address(program.hex())) == row
+
+    # a bad call raises before the file is opened, so it's left as it was
+    with pytest.raises(NetworkError, match=r"Invalid 'unknown' network"):
+        write_addresses(csv_path, xpublic_key=_["wallet"]["xpublic_key"], stop=7, network="unknown")
+    with pytest.raises(ValueError, match=r"Invalid address range"):
+        write_addresses(csv_path, xpublic_key=_["wallet"]["xpublic_key"], start=7, stop=1)
+    with open(csv_path, newline="") as file:
+        assert list(csv.reader(file)) == rows
+
+
+def test_import_wallets():
+
+    expected = Wallet(
+        network="testnet"
+    ).from_mnemonic(
+        mnemonic=_["wallet"]["mnemonic"], passphrase=_["wallet"]["passphrase"]
+    ).from_path(
+        path="m/44/153/1/0/2"
+    )
+    secrets = [
+        (_["wallet"]["mnemonic"], _["wallet"]["passphrase"]),
+        ("not a mnemonic at all " + _["wallet"]["mnemonic"], None),
+        (_["wallet"]["mnemonic"], _["wallet"]["passphrase"])
+    ]
+    derivation_cache.clear()
+    for workers in [1, 2]:
+        imported = list(import_wallets(
+            iter(secrets), path="m/44/153/1/0/2", network="testnet", vapor=True, workers=workers, chunk_size=2
+        ))
+        assert [imported_wallet.position for imported_wallet in imported] == [0, 1, 2]
+        assert imported[0] == imported[2]._replace(position=0) == ImportedWallet(
+            0, expected.xpublic_key(), "m/44/153/1/0/2", expected.public_key(), expected.program(),
+            expected.address(vapor=True), None
+        )
+        assert imported[1].xpublic_key is None and imported[1].error
+        assert _["wallet"]["mnemonic"].split()[0] not in repr(imported[1])
+    # no xprivate node of an imported wallet is left behind in this process
+    assert derivation_cache.info().currsize == 0
+
+    assert list(import_wallets(
+        [_["wallet"]["seed"]], path=_["wallet"]["path"], network="mainnet", from_seed=True, workers=1
+    )) == [ImportedWallet(
+        0, _["wallet"]["xpublic_key"], _["wallet"]["path"], _["wallet"]["public_key"], _["wallet"]["program"],
+        _["wallet"]["address"]["mainnet"], None
+    )]
+    assert list(import_wallets([], workers=2)) == []
+
+    # arguments are checked on call, not on the first imported wallet
+    with pytest.raises(NetworkError, match=r"Invalid 'bogus' network"):
+        import_wallets([], network="bogus")
+    with pytest.raises(ValueError, match=r"Invalid chunk size"):
+        import_wallets([], chunk_size=0)
+
+    # Invalid seeds are reported, errors that aren't about the secret are raised.
+    assert list(import_wallets(["not a seed"], from_seed=True, workers=1)) == [
+        ImportedWallet(0, None, DEFAULT_PATH, None, None, None, "Error")
+    ]
+    with pytest.raises(TypeError):
+        list(import_wallets([None], workers=1))
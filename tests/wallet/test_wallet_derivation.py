@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import pytest
+
+from pybytom.wallet import wallet as _wallet
+from pybytom.wallet import (
+    Wallet, DUMPS_FIELDS
+)
+from pybytom.exceptions import DerivationError
+from pybytom.wallet.cache import derivation_cache
+from pybytom.wallet.keys import (
+    ExtendedPrivateKey, ExtendedPublicKey
+)
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "..", "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+
+def test_incremental_derivation(monkeypatch):
+
+    steps = []
+    child = ExtendedPrivateKey.child
+    monkeypatch.setattr(ExtendedPrivateKey, "child", lambda self, index: steps.append(1) or child(self, index))
+    derivation_cache.clear()
+
+    wallet: Wallet = Wallet(
+        network=_["network"]
+    ).from_xprivate_key(
+        xprivate_key=_["wallet"]["xprivate_key"]
+    ).from_path(
+        path=_["wallet"]["path"]
+    )
+    assert wallet.private_key() == _["wallet"]["private_key"]
+    assert sum(steps) == len(_["wallet"]["indexes"])
+
+    wallet.clean_derivation().from_index(44).from_index(153)
+    wallet.from_index(1).from_index(0).from_index(1)
+    assert wallet.private_key() == _["wallet"]["private_key"]
+
+    wallet.from_indexes(_["wallet"]["indexes"][:3]).from_index(0).from_index(1)
+    assert wallet.private_key() == _["wallet"]["private_key"]
+
+    wallet.from_private_key(_["wallet"]["private_key"]).clean_derivation().from_path(_["wallet"]["path"])
+    assert wallet.private_key() == _["wallet"]["private_key"]
+
+
+def test_one_pass_derivation(monkeypatch):
+
+    wallet: Wallet = Wallet(
+        network=_["network"]
+    ).from_xprivate_key(
+        xprivate_key=_["wallet"]["xprivate_key"]
+    ).from_path(
+        path=_["wallet"]["path"]
+    )
+
+    # Public keys come from the private derivation pass, the public chain is never walked.
+    monkeypatch.setattr(ExtendedPublicKey, "child", None)
+    assert wallet.child_xprivate_key() == _["wallet"]["child_xprivate_key"]
+    assert wallet.child_xpublic_key() == _["wallet"]["child_xpublic_key"]
+    assert wallet.public_key() == _["wallet"]["public_key"]
+    assert wallet.program() == _["wallet"]["program"]
+
+
+def test_memoized_state(monkeypatch):
+
+    calls = []
+    for name in ["get_xpublic_key", "get_program", "get_address", "Signer"]:
+        monkeypatch.setattr(_wallet, name, (
+            lambda name, function: lambda *args, **kwargs: calls.append(name) or function(*args, **kwargs)
+        )(name, getattr(_wallet, name)))
+
+    wallet: Wallet = Wallet(
+        network=_["network"]
+    ).from_xprivate_key(
+        xprivate_key=_["wallet"]["xprivate_key"]
+    ).from_path(
+        path=_["wallet"]["path"]
+    )
+    assert wallet.dumps() == wallet.dumps()
+    assert wallet.sign(_["wallet"]["public_key"]) == wallet.sign(_["wallet"]["public_key"])
+    assert sorted(calls) == ["Signer"] + ["get_address"] * 6 + ["get_program", "get_xpublic_key"]
+
+    # A derivation change recomputes path values only, the xpublic key is kept.
+    del calls[:]
+    wallet.clean_derivation()
+    assert wallet.xpublic_key() == _["wallet"]["xpublic_key"]
+    assert wallet.public_key() == _["wallet"]["xpublic_key"][:64]
+    wallet.from_indexes(_["wallet"]["indexes"])
+    assert wallet.address(network="mainnet") == _["wallet"]["address"]["mainnet"]
+    assert sorted(calls) == ["get_address", "get_program"]
+
+    del calls[:]
+    wallet.from_private_key(_["wallet"]["private_key"])
+    wallet.sign(_["wallet"]["public_key"])
+    wallet.from_xprivate_key(_["wallet"]["child_xprivate_key"])
+    assert wallet.xpublic_key() == _["wallet"]["child_xpublic_key"]
+    assert calls == ["Signer", "get_xpublic_key"]
+
+
+def test_wallet_forks(monkeypatch):
+
+    wallet: Wallet = Wallet(
+        network=_["network"]
+    ).from_xprivate_key(
+        xprivate_key=_["wallet"]["xprivate_key"]
+    )
+    change = wallet.at_path(path="m/44/153/1/0")
+    assert wallet.path() is None and change.path() == "m/44/153/1/0"
+
+    steps = []
+    child = ExtendedPrivateKey.child
+    monkeypatch.setattr(ExtendedPrivateKey, "child", lambda self, index: steps.append(1) or child(self, index))
+    derivation_cache.clear()
+
+    addresses = [change.child(index) for index in range(4)]
+    assert len(steps) == 4 and change.path() == "m/44/153/1/0"
+    assert [address.path() for address in addresses] == [f"m/44/153/1/0/{index}" for index in range(4)]
+    assert addresses[1].private_key() == _["wallet"]["private_key"]
+    assert addresses[1].dumps() == Wallet(
+        network=_["network"]
+    ).from_xprivate_key(
+        xprivate_key=_["wallet"]["xprivate_key"]
+    ).from_path(
+        path=_["wallet"]["path"]
+    ).dumps()
+
+    # Paths below the current one start from its node, others from the root.
+    del steps[:]
+    derivation_cache.clear()
+    assert change.at_path(path=_["wallet"]["path"]).public_key() == _["wallet"]["public_key"]
+    assert len(steps) == 1
+    assert addresses[3].at_path(path="m/44/153/1/0/1").public_key() == _["wallet"]["public_key"]
+    assert change.child(1, harden=True).path() == "m/44/153/1/0/2147483649"
+    assert wallet.child(44).child(153).path() == "m/44/153"
+
+    # Forks are read-only, their parent and siblings are left as they were.
+    for mutate in [
+        lambda fork: fork.from_xprivate_key(xprivate_key=_["wallet"]["xprivate_key"]),
+        lambda fork: fork.from_seed(seed=_["wallet"]["seed"]),
+        lambda fork: fork.from_mnemonic(mnemonic=_["wallet"]["mnemonic"]),
+        lambda fork: fork.from_private_key(private_key=_["wallet"]["private_key"]),
+        lambda fork: fork.from_indexes(indexes=_["wallet"]["indexes"]),
+        lambda fork: fork.from_index(index=1),
+        lambda fork: fork.from_path(path=_["wallet"]["path"]),
+        lambda fork: fork.derivation(),
+        lambda fork: fork.clean_derivation()
+    ]:
+        with pytest.raises(DerivationError, match="You can't change a derived wallet"):
+            mutate(change)
+    assert change.path() == "m/44/153/1/0" and addresses[1].private_key() == _["wallet"]["private_key"]
+    assert wallet.from_path(path=_["wallet"]["path"]).private_key() == _["wallet"]["private_key"]
+
+    with pytest.raises(DerivationError):
+        Wallet(network=_["network"]).child(0)
+    with pytest.raises(DerivationError):
+        wallet.at_path(path="44/153")
+
+
+def test_dumps_fields(monkeypatch):
+
+    wallet: Wallet = Wallet(
+        network=_["network"]
+    ).from_xprivate_key(
+        xprivate_key=_["wallet"]["xprivate_key"]
+    ).from_path(
+        path=_["wallet"]["path"]
+    )
+    dumps = wallet.dumps()
+    assert tuple(dumps) == DUMPS_FIELDS
+
+    calls = []
+    for name in ["get_xpublic_key", "get_expand_xprivate_key", "get_address"]:
+        monkeypatch.setattr(_wallet, name, (
+            lambda name, function: lambda *args, **kwargs: calls.append(name) or function(*args, **kwargs)
+        )(name, getattr(_wallet, name)))
+    wallet = Wallet(network=_["network"]).from_xprivate_key(_["wallet"]["xprivate_key"]).from_path(_["wallet"]["path"])
+
+    assert wallet.dumps(fields=["address", "path"]) == {"address": dumps["address"], "path": dumps["path"]}
+    assert calls == ["get_address"] * 3
+
+    view = wallet.view()
+    assert "program" in view and "unknown" not in view and len(view) == len(DUMPS_FIELDS)
+    assert view["public_key"] == _["wallet"]["public_key"]
+    assert calls == ["get_address"] * 3
+    assert dict(view) == dumps
+
+    # The view follows the wallet derivation.
+    wallet.clean_derivation()
+    assert view["path"] is None and view["public_key"] == _["wallet"]["xpublic_key"][:64]
+
+    with pytest.raises(ValueError, match="Invalid 'unknown' field"):
+        wallet.dumps(fields=["path", "unknown"])
+    with pytest.raises(KeyError):
+        view["unknown"]
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import threading
+
+from pybytom.wallet import discovery
+from pybytom.wallet.discovery import discover
+from pybytom.wallet.tools import (
+    get_public_key, get_program, get_address
+)
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "..", "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+
+def address_of(path: str) -> str:
+    return get_address(get_program(get_public_key(xpublic_key=_["wallet"]["xpublic_key"], path=path)))
+
+
+def test_discover(monkeypatch):
+
+    balances = {
+        address_of("m/44/153/1/0/1"): 100,
+        address_of("m/44/153/1/0/6"): 200,
+        address_of("m/44/153/1/0/12"): 300,
+        address_of("m/44/153/1/1/0"): 400,
+        address_of("m/44/153/2/0/3"): 500,
+        address_of("m/44/153/4/0/0"): 600,
+    }
+    queried, threads = [], set()
+
+    def get_balance(address, **kwargs):
+        queried.append(address)
+        threads.add(threading.get_ident())
+        return balances.get(address, 0)
+
+    def get_utxos(program, **kwargs):
+        return [{"amount": 700}] if program == get_program(get_public_key(
+            xpublic_key=_["wallet"]["xpublic_key"], path="m/44/153/2/1/2"
+        )) else []
+
+    monkeypatch.setattr(discovery, "get_balance", get_balance)
+    monkeypatch.setattr(discovery, "get_utxos", get_utxos)
+
+    # Gap of 5 reaches index 6 but not index 12, account 3 is unused so account 4 is never scanned.
+    found = discover(xpublic_key=_["wallet"]["xpublic_key"], gap_limit=5, network="mainnet", workers=4)
+    assert [address.path for address in found] == [
+        "m/44/153/1/0/1", "m/44/153/1/0/6", "m/44/153/1/1/0", "m/44/153/2/0/3"
+    ]
+    assert [address.balance for address in found] == [100, 200, 400, 500]
+    assert found[0].address == _["wallet"]["address"]["mainnet"] and found[0].program == _["wallet"]["program"]
+    assert len(queried) == 15 + 10 + 10 + 5 + 5 + 5 and len(set(queried)) == len(queried)
+    assert len(threads) > 1
+
+    found = discover(xpublic_key=_["wallet"]["xpublic_key"], gap_limit=6, utxos=True, max_accounts=2)
+    assert [(address.path, address.balance, address.utxos) for address in found] == [
+        ("m/44/153/1/0/1", 100, []), ("m/44/153/1/0/6", 200, []), ("m/44/153/1/0/12", 300, []),
+        ("m/44/153/1/1/0", 400, []), ("m/44/153/2/0/3", 500, []), ("m/44/153/2/1/2", 0, [{"amount": 700}])
+    ]
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import pytest
+
+from pybytom.wallet.index import ProgramIndex
+from pybytom.wallet.tools import (
+    get_program, get_public_key
+)
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "..", "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+
+def test_program_index(tmp_path):
+
+    database = str(tmp_path / "programs.db")
+    with ProgramIndex(xpublic_key=_["wallet"]["xpublic_key"], file_path=database) as program_index:
+        assert program_index.next_index() == 0
+        assert program_index.extend(stop=5) == 5
+        assert program_index.lookup(_["wallet"]["program"]) == _["wallet"]["path"]
+        assert program_index.extend(stop=5) == 0
+        assert program_index.extend(stop=8, account=2, change=1, workers=2, chunk_size=3) == 8
+        assert len(program_index) == 13
+
+    # Reopened index keeps growing from where it stopped.
+    with ProgramIndex(xpublic_key=_["wallet"]["xpublic_key"], file_path=database) as program_index:
+        assert program_index.next_index() == 5
+        assert program_index.extend(stop=12) == 7
+        for path in ["m/44/153/1/0/0", "m/44/153/1/0/11", "m/44/153/2/1/7"]:
+            assert program_index.lookup(get_program(get_public_key(
+                xpublic_key=_["wallet"]["xpublic_key"], path=path
+            ))) == path
+        assert program_index.lookup(get_program(get_public_key(
+            xpublic_key=_["wallet"]["xpublic_key"], path="m/44/153/1/0/12"
+        ))) is None
+
+    with pytest.raises(ValueError, match="another xpublic key"):
+        ProgramIndex(xpublic_key=_["wallet"]["child_xpublic_key"], file_path=database)
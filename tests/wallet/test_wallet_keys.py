@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import pytest
+
+from pybytom.exceptions import DerivationError
+from pybytom.wallet.keys import (
+    ExtendedPrivateKey, ExtendedPublicKey
+)
+from pybytom.wallet.tools import get_bytes
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "..", "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+INDEXES = [get_bytes(index) for index in _["wallet"]["indexes"]]
+
+
+def test_extended_keys():
+
+    xprivate_key = ExtendedPrivateKey.from_hex(_["wallet"]["xprivate_key"])
+    xpublic_key = ExtendedPublicKey.from_hex(_["wallet"]["xpublic_key"])
+    assert xprivate_key.xpublic_key() == xpublic_key
+    assert xprivate_key.public_key() is xprivate_key.public_key()
+    assert xpublic_key.point() is xpublic_key.point()
+    assert bytes(xpublic_key) == get_bytes(_["wallet"]["xpublic_key"])
+    assert xprivate_key.chain_code() == xpublic_key.chain_code()
+    assert _["wallet"]["xprivate_key"] not in repr(xprivate_key)
+
+    child_xprivate_key = xprivate_key.derive(INDEXES)
+    child_xpublic_key = xpublic_key.derive(INDEXES)
+    assert child_xprivate_key.hex() == _["wallet"]["child_xprivate_key"]
+    assert child_xpublic_key.hex() == _["wallet"]["child_xpublic_key"]
+    assert child_xpublic_key.public_key().hex() == _["wallet"]["public_key"]
+    assert child_xprivate_key.xpublic_key() == child_xpublic_key
+    assert xprivate_key.derive(INDEXES[:3]).derive(INDEXES[3:]) == child_xprivate_key
+    assert xprivate_key.derive([]) is xprivate_key
+
+    parent = xpublic_key.derive(INDEXES[:-1])
+    assert parent.children([]) == []
+    assert parent.children(INDEXES[-1:] + INDEXES[:1]) == [parent.child(INDEXES[-1]), parent.child(INDEXES[0])]
+    assert {child_xpublic_key, parent.child(INDEXES[-1])} == {child_xpublic_key}
+
+    for key in [b"", b"\x00" * 63, b"\x00" * 65]:
+        with pytest.raises(ValueError):
+            ExtendedPrivateKey(key)
+        with pytest.raises(ValueError):
+            ExtendedPublicKey(key)
+    with pytest.raises(AttributeError):
+        xpublic_key.label = "slots"
+
+    # A child scalar past 256 bits is refused, not truncated.
+    with pytest.raises(DerivationError, match="does not fit in 256-bit int"):
+        ExtendedPrivateKey(b"\xff" * 32 + xprivate_key.chain_code()).child(INDEXES[0])
@@ -2,11 +2,13 @@
 
 import json
 import os
+import pytest
 
+from pybytom.wallet.cache import derivation_cache
 from pybytom.wallet.tools import (
     path_to_indexes, indexes_to_path, get_xpublic_key, get_expand_xprivate_key,
-    get_child_xprivate_key, get_child_xpublic_key, get_private_key,
-    get_public_key, get_program, get_address
+    get_child_xprivate_key, get_child_xpublic_key, get_child_xpublic_keys, get_private_key,
+    get_public_key, get_program, get_address, iter_addresses, get_child_xkeys
 )
 
 # Test Values
@@ -45,6 +47,19 @@ def test_wallet_tools():
         xpublic_key=_["wallet"]["xpublic_key"], path=_["wallet"]["path"]
     ) == _["wallet"]["child_xpublic_key"]
 
+    assert get_child_xpublic_keys(
+        xpublic_key=_["wallet"]["xpublic_key"], children=[]
+    ) == []
+    assert get_child_xpublic_keys(
+        xpublic_key=_["wallet"]["xpublic_key"], children=["00000000", "01000000", "02000000"], path="m/44/153/1/0"
+    ) == [
+        get_child_xpublic_key(xpublic_key=_["wallet"]["xpublic_key"], path=f"m/44/153/1/0/{address}")
+        for address in range(3)
+    ]
+    assert get_child_xpublic_keys(
+        xpublic_key=_["wallet"]["xpublic_key"], children=["01000000"], indexes=_["wallet"]["indexes"][:-1]
+    ) == [_["wallet"]["child_xpublic_key"]]
+
     assert get_private_key(
         xprivate_key=_["wallet"]["xprivate_key"]
     ) == _["wallet"]["xprivate_key"]
@@ -86,3 +101,83 @@ def test_wallet_tools():
     assert get_address(
         program=_["wallet"]["program"], network="testnet", vapor=True
     ) == _["wallet"]["vapor_address"]["testnet"]
+
+
+def test_get_child_xkeys():
+
+    assert get_child_xkeys(
+        xprivate_key=_["wallet"]["xprivate_key"]
+    ) == (_["wallet"]["xprivate_key"], _["wallet"]["xpublic_key"])
+    for derivation in [dict(indexes=_["wallet"]["indexes"]), dict(path=_["wallet"]["path"])]:
+        assert get_child_xkeys(
+            xprivate_key=_["wallet"]["xprivate_key"], **derivation
+        ) == (_["wallet"]["child_xprivate_key"], _["wallet"]["child_xpublic_key"])
+
+
+def test_iter_addresses():
+
+    for network in ["mainnet", "solonet", "testnet"]:
+        assert list(iter_addresses(
+            xpublic_key=_["wallet"]["xpublic_key"], start=1, stop=2, network=network
+        )) == [(1, _["wallet"]["public_key"], _["wallet"]["program"], _["wallet"]["address"][network])]
+
+    addresses = list(iter_addresses(
+        xpublic_key=_["wallet"]["xpublic_key"], account=2, change=1, start=3, stop=10, vapor=True, chunk_size=3
+    ))
+    assert [address[0] for address in addresses] == list(range(3, 10))
+    for index, public_key, program, address in addresses:
+        assert public_key == get_public_key(
+            xpublic_key=_["wallet"]["xpublic_key"], path=f"m/44/153/2/1/{index}"
+        )
+        assert program == get_program(public_key=public_key)
+        assert address == get_address(program=program, network="mainnet", vapor=True)
+
+    assert next(iter_addresses(xpublic_key=_["wallet"]["xpublic_key"]))[0] == 0
+    assert list(iter_addresses(xpublic_key=_["wallet"]["xpublic_key"], start=5, stop=5)) == []
+    with pytest.raises(ValueError):
+        next(iter_addresses(xpublic_key=_["wallet"]["xpublic_key"], start=2, stop=1))
+
+
+def test_derivation_cache():
+
+    derivation_cache.clear()
+    try:
+        # Xprivate nodes are only cached once asked for.
+        assert get_child_xprivate_key(
+            xprivate_key=_["wallet"]["xprivate_key"], path=_["wallet"]["path"]
+        ) == _["wallet"]["child_xprivate_key"]
+        assert derivation_cache.info() == (0, 0, 4096, 0)
+
+        derivation_cache.set_private(True)
+        for _i in range(2):
+            assert get_child_xprivate_key(
+                xprivate_key=_["wallet"]["xprivate_key"], path=_["wallet"]["path"]
+            ) == _["wallet"]["child_xprivate_key"]
+        info = derivation_cache.info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 5)
+
+        # Siblings start from their cached parent, xpublic nodes are kept apart.
+        assert get_child_xpublic_keys(
+            xpublic_key=_["wallet"]["xpublic_key"], children=["01000000"], path="m/44/153/1/0"
+        ) == [_["wallet"]["child_xpublic_key"]]
+        assert get_child_xpublic_key(
+            xpublic_key=_["wallet"]["xpublic_key"], path=_["wallet"]["path"]
+        ) == _["wallet"]["child_xpublic_key"]
+        info = derivation_cache.info()
+        assert (info.hits, info.misses, info.currsize) == (2, 2, 10)
+
+        derivation_cache.set_private(False)
+        assert derivation_cache.info().currsize == 5
+        derivation_cache.set_private(True)
+
+        derivation_cache.resize(3)
+        assert derivation_cache.info().currsize == 3
+        derivation_cache.resize(0)
+        assert get_child_xprivate_key(
+            xprivate_key=_["wallet"]["xprivate_key"], indexes=_["wallet"]["indexes"]
+        ) == _["wallet"]["child_xprivate_key"]
+        assert derivation_cache.info().currsize == 0
+    finally:
+        derivation_cache.set_private(False)
+        derivation_cache.resize(4096)
+        derivation_cache.clear()
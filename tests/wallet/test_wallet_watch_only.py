@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import pytest
+
+from pybytom.wallet import (
+    Wallet, WatchOnlyWallet, WatchOnlyWallets
+)
+from pybytom.exceptions import NetworkError
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "..", "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+
+def test_watch_only_wallet():
+
+    watch_only_wallet = WatchOnlyWallet(
+        xpublic_key=_["wallet"]["xpublic_key"], path=_["wallet"]["path"], network="testnet"
+    )
+    assert not hasattr(watch_only_wallet, "__dict__")
+    assert watch_only_wallet.xpublic_key() == _["wallet"]["child_xpublic_key"]
+    assert watch_only_wallet.public_key() == _["wallet"]["public_key"]
+    assert watch_only_wallet.program() == _["wallet"]["program"]
+    assert watch_only_wallet.address() == _["wallet"]["address"]["testnet"]
+    assert watch_only_wallet.address(network="mainnet") == _["wallet"]["address"]["mainnet"]
+
+    change = WatchOnlyWallet(xpublic_key=_["wallet"]["xpublic_key"], path="m/44/153/1/0")
+    assert change.child(1) == WatchOnlyWallet(xpublic_key=_["wallet"]["xpublic_key"], path=_["wallet"]["path"])
+    assert change.child(2).address() == Wallet(
+        network="mainnet"
+    ).from_xprivate_key(
+        xprivate_key=_["wallet"]["xprivate_key"]
+    ).from_path(
+        path="m/44/153/1/0/2"
+    ).address()
+
+    with pytest.raises(NetworkError):
+        WatchOnlyWallet(xpublic_key=_["wallet"]["xpublic_key"], network="unknown")
+
+
+def test_watch_only_wallets():
+
+    change = WatchOnlyWallet(xpublic_key=_["wallet"]["xpublic_key"], path="m/44/153/1/0", network="solonet")
+    children = [change.child(index) for index in range(5)]
+
+    watch_only_wallets = WatchOnlyWallets(network="solonet", xpublic_keys=[children[0].xpublic_key()])
+    watch_only_wallets.extend(children[1:3])
+    watch_only_wallets.append(bytes.fromhex(children[3].xpublic_key()))
+    assert len(watch_only_wallets) == 4
+    assert list(watch_only_wallets) == children[:4]
+    assert watch_only_wallets[-1] == children[3]
+    assert watch_only_wallets[1].address() == _["wallet"]["address"]["solonet"]
+
+    assert watch_only_wallets.index(_["wallet"]["program"]) == 1
+    assert children[2].program() in watch_only_wallets
+    assert children[4].program() not in watch_only_wallets
+    with pytest.raises(ValueError):
+        watch_only_wallets.index(children[4].program())
+    with pytest.raises(IndexError):
+        watch_only_wallets[4]
+    with pytest.raises(ValueError):
+        watch_only_wallets.append(_["wallet"]["public_key"])
+
+    # Programs other than 0014 and a 20 bytes hash never match, even across entries.
+    for program in [
+        children[0].program() + children[1].program()[4:28], children[0].program()[:24],
+        "0020" + children[0].program()[4:] + "00" * 12
+    ]:
+        assert program not in watch_only_wallets
+        with pytest.raises(ValueError, match="Invalid program"):
+            watch_only_wallets.index(program)
+
+    with pytest.raises(ValueError, match="'mainnet' watch-only wallet network"):
+        watch_only_wallets.append(WatchOnlyWallet(xpublic_key=children[4].xpublic_key(), network="mainnet"))
+    assert len(watch_only_wallets) == 4